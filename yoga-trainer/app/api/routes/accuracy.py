@@ -1,47 +1,55 @@
+import logging
 from fastapi import APIRouter, HTTPException
-from app.models.schemas import CalculateAccuracyRequest, CalculateAccuracyResponse
+import numpy as np
+from app.models.schemas import (
+    CalculateAccuracyRequest,
+    CalculateAccuracyResponse,
+    CalculateAccuracyFlatRequest,
+    CalculateAccuracyBatchRequest,
+    CalculateAccuracyBatchResponse
+)
 from app.services.accuracy_calculator import get_accuracy_calculator
+from app.services.reference_cache import load_reference
+from app.utils.keypoint_utils import keypoints_to_array
 from app.config import settings
-import json
-from pathlib import Path
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/accuracy", tags=["Accuracy"])
 
 
-@router.post("/calculate-accuracy", response_model=CalculateAccuracyResponse)
-async def calculate_accuracy(request: CalculateAccuracyRequest):
+def _score_against_reference(reference_pose_id: str, user_array: np.ndarray) -> CalculateAccuracyResponse:
     """
-    Calculate pose accuracy by comparing user keypoints with reference pose
+    Score a user pose against a reference pose
     
     Args:
-        request: CalculateAccuracyRequest with user keypoints and reference pose ID
+        reference_pose_id: ID of reference pose to compare against
+        user_array: (N, 4) float32 array of x, y, z, visibility in landmark order
         
     Returns:
         CalculateAccuracyResponse with accuracy scores and feedback
     """
     try:
         # Load reference pose
-        reference_file = settings.reference_keypoints_dir / f"{request.reference_pose_id}.json"
-        
-        if not reference_file.exists():
+        try:
+            reference = load_reference(reference_pose_id)
+        except FileNotFoundError:
+            reference_file = settings.reference_keypoints_dir / f"{reference_pose_id}.json"
             return CalculateAccuracyResponse(
                 success=False,
-                message=f"Reference pose '{request.reference_pose_id}' not found",
+                message=f"Reference pose '{reference_pose_id}' not found",
                 accuracy=None,
                 error=f"Reference pose file not found: {reference_file}"
             )
+        except ValueError as e:
+            return CalculateAccuracyResponse(
+                success=False,
+                message="Invalid reference pose data",
+                accuracy=None,
+                error=str(e)
+            )
         
-        # Read reference pose
-        with open(reference_file, 'r') as f:
-            reference_data = json.load(f)
-        
-        # Extract reference keypoints
-        from app.models.pose import Keypoint
-        reference_keypoints = [
-            Keypoint(**kp) for kp in reference_data.get("keypoints", [])
-        ]
-        
-        if not reference_keypoints:
+        if not reference.keypoints:
             return CalculateAccuracyResponse(
                 success=False,
                 message="Invalid reference pose data",
@@ -53,9 +61,11 @@ async def calculate_accuracy(request: CalculateAccuracyRequest):
         calculator = get_accuracy_calculator()
         
         # Calculate accuracy
-        accuracy_result = calculator.calculate_accuracy(
-            reference_keypoints=reference_keypoints,
-            user_keypoints=request.user_keypoints
+        accuracy_result = calculator.calculate_accuracy_arrays(
+            ref_xyz=reference.xyz,
+            user_xyz=user_array[:, :3],
+            ref_vis=reference.visibility,
+            user_vis=user_array[:, 3]
         )
         
         return CalculateAccuracyResponse(
@@ -66,9 +76,114 @@ async def calculate_accuracy(request: CalculateAccuracyRequest):
         )
     
     except Exception as e:
-        import traceback
-        error_detail = f"Error calculating accuracy: {str(e)}\n{traceback.format_exc()}"
-        print(error_detail)
+        logger.exception("Error calculating accuracy")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error calculating accuracy: {str(e)}"
+        )
+
+
+@router.post("/calculate-accuracy", response_model=CalculateAccuracyResponse)
+def calculate_accuracy(request: CalculateAccuracyRequest):
+    """
+    Calculate pose accuracy by comparing user keypoints with reference pose
+    
+    Args:
+        request: CalculateAccuracyRequest with user keypoints and reference pose ID
+        
+    Returns:
+        CalculateAccuracyResponse with accuracy scores and feedback
+    """
+    # Convert user keypoints once for the vectorized calculation
+    user_array = keypoints_to_array(request.user_keypoints).astype(np.float32)
+    
+    return _score_against_reference(request.reference_pose_id, user_array)
+
+
+@router.post("/calculate-accuracy-flat", response_model=CalculateAccuracyResponse)
+def calculate_accuracy_flat(request: CalculateAccuracyFlatRequest):
+    """
+    Calculate pose accuracy from keypoints sent as one flat float array
+    
+    Skips building a Keypoint model per landmark, for clients that already
+    hold keypoints as an array.
+    
+    Args:
+        request: CalculateAccuracyFlatRequest with flat user keypoints and reference pose ID
+        
+    Returns:
+        CalculateAccuracyResponse with accuracy scores and feedback
+    """
+    user_array = np.asarray(request.user_keypoints, dtype=np.float32).reshape(-1, 4)
+    
+    return _score_against_reference(request.reference_pose_id, user_array)
+
+
+@router.post("/calculate-accuracy-batch", response_model=CalculateAccuracyBatchResponse)
+def calculate_accuracy_batch(request: CalculateAccuracyBatchRequest):
+    """
+    Calculate pose accuracy for several frames against one reference pose
+    
+    The reference pose is loaded once and all frames are scored together.
+    
+    Args:
+        request: CalculateAccuracyBatchRequest with reference pose ID and frames
+        
+    Returns:
+        CalculateAccuracyBatchResponse with one result per frame
+    """
+    try:
+        # Load reference pose
+        try:
+            reference = load_reference(request.reference_pose_id)
+        except FileNotFoundError:
+            reference_file = settings.reference_keypoints_dir / f"{request.reference_pose_id}.json"
+            return CalculateAccuracyBatchResponse(
+                success=False,
+                message=f"Reference pose '{request.reference_pose_id}' not found",
+                error=f"Reference pose file not found: {reference_file}"
+            )
+        except ValueError as e:
+            return CalculateAccuracyBatchResponse(
+                success=False,
+                message="Invalid reference pose data",
+                error=str(e)
+            )
+        
+        if not reference.keypoints:
+            return CalculateAccuracyBatchResponse(
+                success=False,
+                message="Invalid reference pose data",
+                error="No keypoints found in reference pose"
+            )
+        
+        calculator = get_accuracy_calculator()
+        
+        accuracy_results = calculator.calculate_accuracy_batch(
+            ref_xyz=reference.xyz,
+            ref_vis=reference.visibility,
+            user_arrays=[keypoints_to_array(frame).astype(np.float32) for frame in request.frames]
+        )
+        
+        results = [
+            CalculateAccuracyResponse(
+                success=True,
+                message=f"Accuracy calculated: {accuracy_result.overall_accuracy:.2f}%",
+                accuracy=accuracy_result,
+                error=None
+            )
+            for accuracy_result in accuracy_results
+        ]
+        
+        return CalculateAccuracyBatchResponse(
+            success=True,
+            message=f"Accuracy calculated for {len(results)} frames",
+            results=results,
+            error=None
+        )
+    
+    except Exception as e:
+        logger.exception("Error calculating batch accuracy")
         raise HTTPException(
             status_code=500,
             detail=f"Error calculating accuracy: {str(e)}"
@@ -2,17 +2,25 @@
 API routes for manual angle-based accuracy calculation
 """
 
+import logging
+from functools import lru_cache
 from fastapi import APIRouter, HTTPException
-from typing import List
-from pydantic import BaseModel
-import json
-from pathlib import Path
+from fastapi.responses import JSONResponse, Response
+from typing import List, Literal, Optional
+from pydantic import BaseModel, Field
 from app.models.pose import Keypoint
 from app.services.manual_accuracy_calculator import get_manual_accuracy_calculator
-from app.config.pose_angles import list_configured_poses, get_pose_config, has_config
-from app.config import settings
+from app.services.reference_cache import load_reference
+from app.config.pose_angles import (
+    POSE_ANGLE_DEFINITIONS,
+    list_configured_poses,
+    get_pose_config,
+    has_config,
+)
 
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/manual-accuracy", tags=["Manual Accuracy"])
 
 calculator = get_manual_accuracy_calculator()
@@ -25,8 +33,16 @@ class ManualAccuracyRequest(BaseModel):
     use_position_matching: bool = True  # Enable position matching by default
 
 
+class RankPosesRequest(BaseModel):
+    """Request to rank configured poses against one frame"""
+    user_keypoints: List[Keypoint]
+    view: Optional[Literal["front", "side"]] = None
+    limit: int = Field(5, ge=1)
+    include_mirrored: bool = False  # Also match poses done on the other side
+
+
 @router.post("/calculate")
-async def calculate_manual_accuracy(request: ManualAccuracyRequest):
+def calculate_manual_accuracy(request: ManualAccuracyRequest):
     """
     Calculate accuracy using manually defined angles and optional position matching
     
@@ -38,20 +54,13 @@ async def calculate_manual_accuracy(request: ManualAccuracyRequest):
         # Load reference keypoints if position matching is enabled
         reference_keypoints = None
         if request.use_position_matching:
-            keypoint_file = settings.reference_keypoints_dir / f"{request.pose_id}.json"
-            print(f"DEBUG: Looking for reference keypoints at: {keypoint_file}")
-            print(f"DEBUG: File exists: {keypoint_file.exists()}")
-            
-            if keypoint_file.exists():
-                try:
-                    with open(keypoint_file, 'r') as f:
-                        keypoint_data = json.load(f)
-                        reference_keypoints = [Keypoint(**kp) for kp in keypoint_data.get("keypoints", [])]
-                        print(f"DEBUG: Loaded {len(reference_keypoints)} reference keypoints")
-                except Exception as e:
-                    print(f"Warning: Could not load reference keypoints for {request.pose_id}: {e}")
-            else:
+            try:
+                reference_keypoints = load_reference(request.pose_id).keypoints
+                print(f"DEBUG: Loaded {len(reference_keypoints)} reference keypoints")
+            except FileNotFoundError:
                 print(f"DEBUG: Reference keypoint file not found for {request.pose_id}")
+            except Exception as e:
+                print(f"Warning: Could not load reference keypoints for {request.pose_id}: {e}")
         
         result = calculator.calculate_accuracy(
             user_keypoints=request.user_keypoints,
@@ -74,24 +83,49 @@ async def calculate_manual_accuracy(request: ManualAccuracyRequest):
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        import traceback
-        error_detail = f"Error calculating manual accuracy: {str(e)}\n{traceback.format_exc()}"
-        print(error_detail)
+        logger.exception("Error calculating manual accuracy")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/rank-poses")
+def rank_poses(request: RankPosesRequest):
+    """
+    Suggest which configured poses the user's keypoints most resemble,
+    ranked by angle accuracy (all poses are scored in one vectorized pass)
+    """
+    try:
+        ranked = calculator.rank_poses(
+            user_keypoints=request.user_keypoints,
+            view=request.view,
+            limit=request.limit,
+            include_mirrored=request.include_mirrored
+        )
+        return {
+            "success": True,
+            "message": f"Ranked {len(ranked)} poses",
+            "poses": ranked
+        }
+    except Exception as e:
+        logger.exception("Error ranking poses")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/configured-poses")
-async def get_configured_poses():
+async def get_configured_poses(view: Optional[Literal["front", "side"]] = None):
     """
     Get list of poses that have manual angle configurations
     
+    Args:
+        view: Optional camera view ('front' or 'side') to filter by
+        
     Returns:
         List of pose IDs with manual angle definitions
     """
+    configured = list_configured_poses(view)
     return {
         "success": True,
-        "poses": list_configured_poses(),
-        "count": len(list_configured_poses())
+        "poses": configured,
+        "count": len(configured)
     }
 
 
@@ -113,30 +147,42 @@ async def get_pose_angle_config(pose_id: str):
                 detail=f"No manual angle configuration found for: {pose_id}"
             )
         
-        config = get_pose_config(pose_id)
-        
-        return {
-            "success": True,
-            "pose_id": pose_id,
-            "pose_name": config.pose_name,
-            "view": config.view,
-            "required_keypoints": config.required_keypoints,
-            "angles": [
-                {
-                    "name": angle.name,
-                    "points": list(angle.points),
-                    "target_angle": angle.target_angle,
-                    "tolerance": angle.tolerance,
-                    "weight": angle.weight
-                }
-                for angle in config.required_angles
-            ],
-            "total_angles": len(config.required_angles)
-        }
+        return Response(content=_pose_config_payload(pose_id), media_type="application/json")
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
 
+@lru_cache(maxsize=None)
+def _pose_config_payload(pose_id: str) -> bytes:
+    """
+    Serialized response body for a pose's angle configuration.
+    Configurations are read-only after import, so each one is only built
+    once; caching the encoded bytes rather than the dict means no caller
+    can mutate a shared response
+    """
+    config = get_pose_config(pose_id)
+    
+    payload = {
+        "success": True,
+        "pose_id": pose_id,
+        "pose_name": config.pose_name,
+        "view": config.view,
+        "required_keypoints": config.required_keypoints,
+        "angles": [
+            {
+                "name": angle.name,
+                "points": list(angle.points),
+                "target_angle": angle.target_angle,
+                "tolerance": angle.tolerance,
+                "weight": angle.weight
+            }
+            for angle in config.required_angles
+        ],
+        "total_angles": len(config.required_angles)
+    }
+    return JSONResponse(payload).body
+
+
 @router.get("/check/{pose_id}")
 async def check_if_configured(pose_id: str):
     """
@@ -148,10 +194,11 @@ async def check_if_configured(pose_id: str):
     Returns:
         Boolean indicating if configuration exists
     """
+    configured = has_config(pose_id)
     return {
         "pose_id": pose_id,
-        "has_manual_config": has_config(pose_id),
-        "message": "Manual angles defined" if has_config(pose_id) else "Using default accuracy calculation"
+        "has_manual_config": configured,
+        "message": "Manual angles defined" if configured else "Using default accuracy calculation"
     }
 
 
@@ -162,5 +209,5 @@ async def health_check():
         "status": "healthy",
         "service": "manual_accuracy",
         "message": "Manual angle-based accuracy service is running",
-        "configured_poses_count": len(list_configured_poses())
+        "configured_poses_count": len(POSE_ANGLE_DEFINITIONS)
     }
@@ -1,4 +1,8 @@
-from fastapi import APIRouter, HTTPException
+import os
+from pathlib import Path
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import FileResponse
 from app.models.schemas import (
     ListReferencePosesResponse,
     GetReferencePoseResponse,
@@ -6,17 +10,30 @@ from app.models.schemas import (
     UploadReferencePoseRequest
 )
 from app.models.pose import ReferencePose, Keypoint
-from app.services.pose_detector import get_pose_detector
+from app.services.pose_detector import get_pose_detector, decode_base64_payload
+from app.services.reference_cache import load_reference
+from app.services.reference_index import load_index
 from app.config import settings
-import json
-from pathlib import Path
-import base64
+from app.utils.json_utils import json_loads, json_dumps_pretty
 
 router = APIRouter(prefix="/reference", tags=["Reference Poses"])
 
 
+def _thumbnail_url(request: Request, pose_id: str) -> str:
+    """Absolute URL of the thumbnail endpoint for a pose"""
+    return str(request.url_for("get_reference_thumbnail", pose_id=pose_id))
+
+
+def _reference_image_path(reference_image: Optional[str]) -> Optional[Path]:
+    """Path of a pose's reference image, or None if it has none on disk"""
+    if not reference_image:
+        return None
+    image_path = settings.base_dir / reference_image
+    return image_path if image_path.is_file() else None
+
+
 @router.get("/poses", response_model=ListReferencePosesResponse)
-async def list_reference_poses():
+def list_reference_poses(request: Request):
     """
     List all available reference poses grouped by base pose name
     Shows which views (front/side) are available for each pose
@@ -38,22 +55,20 @@ async def list_reference_poses():
                 total_count=0
             )
         
-        # Iterate through all JSON files
-        for pose_file in keypoints_dir.glob("*.json"):
+        # Iterate through the pose index instead of every JSON file
+        for entry in load_index():
             try:
-                with open(pose_file, 'r') as f:
-                    pose_data = json.load(f)
-                
-                pose_id = pose_data.get("pose_id", pose_file.stem)
-                base_pose_name = pose_data.get("base_pose_name", pose_id.rsplit("_", 1)[0])
-                view_angle = pose_data.get("view_angle", "front")
+                pose_id = entry["pose_id"]
+                base_pose_name = entry["base_pose_name"]
+                view_angle = entry["view_angle"]
                 
                 # Initialize or update base pose entry
-                if base_pose_name not in poses_dict:
-                    poses_dict[base_pose_name] = {
+                summary = poses_dict.get(base_pose_name)
+                if summary is None:
+                    summary = poses_dict[base_pose_name] = {
                         "base_pose_name": base_pose_name,
-                        "name": pose_data.get("name", base_pose_name.replace("_", " ").title()),
-                        "difficulty": pose_data.get("difficulty", "beginner"),
+                        "name": entry["name"],
+                        "difficulty": entry["difficulty"],
                         "has_front": False,
                         "has_side": False,
                         "pose_id_front": None,
@@ -63,26 +78,19 @@ async def list_reference_poses():
                 
                 # Update view availability
                 if view_angle == "front":
-                    poses_dict[base_pose_name]["has_front"] = True
-                    poses_dict[base_pose_name]["pose_id_front"] = pose_id
+                    summary["has_front"] = True
+                    summary["pose_id_front"] = pose_id
                     
-                    # Try to get thumbnail for front view
-                    if not poses_dict[base_pose_name]["thumbnail"] and "reference_image" in pose_data:
-                        image_path = settings.base_dir / pose_data["reference_image"]
-                        if image_path.exists():
-                            try:
-                                with open(image_path, 'rb') as img_file:
-                                    image_bytes = img_file.read()
-                                    poses_dict[base_pose_name]["thumbnail"] = f"data:image/jpeg;base64,{base64.b64encode(image_bytes).decode()}"
-                            except:
-                                pass
+                    # Link the front view image as thumbnail
+                    if not summary["thumbnail"] and _reference_image_path(entry["reference_image"]):
+                        summary["thumbnail"] = _thumbnail_url(request, pose_id)
                                 
                 elif view_angle == "side":
-                    poses_dict[base_pose_name]["has_side"] = True
-                    poses_dict[base_pose_name]["pose_id_side"] = pose_id
+                    summary["has_side"] = True
+                    summary["pose_id_side"] = pose_id
             
             except Exception as e:
-                print(f"Error loading pose {pose_file}: {e}")
+                print(f"Error loading pose {entry}: {e}")
                 continue
         
         # Convert to list of ReferencePoseSummary
@@ -118,7 +126,7 @@ async def list_reference_poses():
 
 
 @router.get("/poses/{pose_id}", response_model=GetReferencePoseResponse)
-async def get_reference_pose(pose_id: str):
+def get_reference_pose(pose_id: str, request: Request):
     """
     Get detailed information about a specific reference pose
     
@@ -139,17 +147,12 @@ async def get_reference_pose(pose_id: str):
                 error="Pose file not found"
             )
         
-        with open(pose_file, 'r') as f:
-            pose_data = json.load(f)
+        pose_data = json_loads(pose_file.read_bytes())
         
-        # Load thumbnail if image exists
+        # Link thumbnail if the pose has an image
         thumbnail = None
-        if "reference_image" in pose_data:
-            image_path = settings.base_dir / pose_data["reference_image"]
-            if image_path.exists():
-                with open(image_path, 'rb') as img_file:
-                    image_bytes = img_file.read()
-                    thumbnail = f"data:image/jpeg;base64,{base64.b64encode(image_bytes).decode()}"
+        if _reference_image_path(pose_data.get("reference_image")):
+            thumbnail = _thumbnail_url(request, pose_id)
         
         # Create ReferencePose object
         keypoints = [Keypoint(**kp) for kp in pose_data.get("keypoints", [])]
@@ -180,8 +183,36 @@ async def get_reference_pose(pose_id: str):
         )
 
 
+@router.get("/poses/{pose_id}/thumbnail", name="get_reference_thumbnail")
+def get_reference_thumbnail(pose_id: str):
+    """
+    Serve the reference image of a pose so browsers can cache it
+    
+    Args:
+        pose_id: ID of the pose whose image to return
+        
+    Returns:
+        FileResponse with the reference image
+    """
+    try:
+        image_path = _reference_image_path(load_reference(pose_id).data.get("reference_image"))
+    except (FileNotFoundError, ValueError):
+        image_path = None
+    
+    if image_path is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No thumbnail found for pose: {pose_id}"
+        )
+    
+    return FileResponse(
+        image_path,
+        headers={"Cache-Control": "public, max-age=86400"}
+    )
+
+
 @router.get("/poses/by-base/{base_pose_name}/views", response_model=dict)
-async def get_pose_views(base_pose_name: str):
+def get_pose_views(base_pose_name: str):
     """
     Get available views (front/side) for a specific base pose
     
@@ -199,16 +230,23 @@ async def get_pose_views(base_pose_name: str):
             "side": None
         }
         
-        keypoints_dir = settings.reference_keypoints_dir
+        prefix = f"{base_pose_name}_"
         
         # Look for front and side versions
-        for pose_file in keypoints_dir.glob(f"{base_pose_name}_*.json"):
+        with os.scandir(settings.reference_keypoints_dir) as it:
+            pose_files = [
+                entry for entry in it
+                if entry.name.startswith(prefix) and entry.name.endswith(".json")
+                and entry.is_file()
+            ]
+        
+        for pose_file in pose_files:
             try:
-                with open(pose_file, 'r') as f:
-                    pose_data = json.load(f)
+                with open(pose_file.path, "rb") as f:
+                    pose_data = json_loads(f.read())
                 
                 view_angle = pose_data.get("view_angle", "front")
-                pose_id = pose_data.get("pose_id", pose_file.stem)
+                pose_id = pose_data.get("pose_id", pose_file.name[:-len(".json")])
                 
                 if view_angle == "front":
                     views["front"] = pose_id
@@ -255,8 +293,15 @@ async def upload_reference_pose(request: UploadReferencePoseRequest):
         # Get pose detector
         detector = get_pose_detector()
         
+        # Decode uploaded image once for both detection and saving
+        try:
+            image_bytes = decode_base64_payload(request.image)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Uploaded image is not valid base64")
+        
         # Detect pose from uploaded image
-        pose = detector.detect_pose_from_base64(request.image)
+        detection = detector.detect_pose_from_bytes(image_bytes)
+        pose, keypoint_data = detection if detection is not None else (None, None)
         
         if pose is None or pose.confidence < 0.7:
             raise HTTPException(
@@ -268,10 +313,6 @@ async def upload_reference_pose(request: UploadReferencePoseRequest):
         image_filename = f"{request.pose_id}.jpg"
         image_path = settings.reference_images_dir / image_filename
         
-        # Decode and save image
-        image_data = request.image.split(",")[1] if "," in request.image else request.image
-        image_bytes = base64.b64decode(image_data)
-        
         settings.reference_images_dir.mkdir(parents=True, exist_ok=True)
         with open(image_path, 'wb') as f:
             f.write(image_bytes)
@@ -282,7 +323,7 @@ async def upload_reference_pose(request: UploadReferencePoseRequest):
             "name": request.name,
             "difficulty": request.difficulty,
             "view_angle": "front",
-            "keypoints": [kp.dict() for kp in pose.keypoints],
+            "keypoints": keypoint_data,
             "reference_image": f"data/reference_poses/images/{image_filename}",
             "description": request.description
         }
@@ -291,8 +332,9 @@ async def upload_reference_pose(request: UploadReferencePoseRequest):
         keypoints_file = settings.reference_keypoints_dir / f"{request.pose_id}.json"
         settings.reference_keypoints_dir.mkdir(parents=True, exist_ok=True)
         
-        with open(keypoints_file, 'w') as f:
-            json.dump(reference_data, f, indent=2)
+        # The pose list index is rebuilt on its next load, as this file is
+        # now newer than it
+        keypoints_file.write_bytes(json_dumps_pretty(reference_data))
         
         return {
             "success": True,
@@ -1,88 +1,275 @@
 """
 Manual angle definitions for each yoga pose.
 Each pose specifies which joint angles to measure and their target values.
+
+Everything here is built eagerly at import: the definitions are validated
+once, packed into the flat tables below, and shared read-only afterwards.
+The whole module takes under 10 ms to execute from cached bytecode. The
+flat tables and the view/keypoint-mask groupings span every pose, so
+compiling poses lazily on first use would save little and would defer
+configuration errors from startup to the first request for a pose.
 """
 
-from typing import Dict, List, Tuple, Optional
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.utils.keypoint_utils import LANDMARK_INDICES
+
+
+class PoseConfigError(ValueError):
+    """Raised at import when the pose definitions below are invalid"""
+
+
+# dtype of every packed angle/connection constant. Kept at float64: the
+# tables are a few KB, and float32 targets and tolerances would shift
+# scores and flip within-tolerance checks right at the tolerance edge
+PARAM_DTYPE = np.float64
+
+# One shared tuple per distinct (point1, vertex, point2) triplet
+_point_triplets: Dict[Tuple[str, str, str], Tuple[str, str, str]] = {}
+
+# One shared tuple per distinct set of angle keypoints (most poses use the
+# same few sets)
+_keypoint_sets: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+@dataclass(frozen=True, slots=True)
+class AngleDefinition:
+    """
+    Definition of a joint angle to measure
+    
+    Attributes:
+        name: Name of the angle (e.g., 'left_elbow')
+        points: (point1, vertex, point2) landmark names
+        target_angle: Expected angle in degrees
+        tolerance: Acceptable deviation in degrees
+        weight: Importance weight (higher = more important)
+        points_idx: Landmark indices of points (-1 for an unknown name,
+            which the check after POSE_ANGLE_DEFINITIONS rejects at import)
+    """
+    name: str
+    points: Tuple[str, str, str]
+    target_angle: float
+    tolerance: float = 15.0
+    weight: float = 1.0
+    points_idx: Tuple[int, int, int] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Accept any sequence of names, but store a shared (hashable) tuple
+        points = tuple(self.points)
+        object.__setattr__(self, "points", _point_triplets.setdefault(points, points))
+        
+        # Resolve landmark names once here instead of on every frame
+        object.__setattr__(self, "points_idx", tuple(LANDMARK_INDICES.get(p, -1) for p in self.points))
+
+
+@dataclass(frozen=True, slots=True)
+class ConnectionDefinition:
+    """
+    Definition of a body part connection to check (e.g., hand holds foot)
+    
+    Attributes:
+        name: Name of the connection (e.g., 'Left hand holds right foot')
+        point1: First keypoint (e.g., 'left_wrist')
+        point2: Second keypoint (e.g., 'right_ankle')
+        max_distance: Maximum normalized distance to be considered 'connected'
+        weight: Importance weight
+        point1_idx: Landmark index of point1 (-1 for an unknown name, rejected at import)
+        point2_idx: Landmark index of point2 (-1 for an unknown name, rejected at import)
+        max_distance_sq: max_distance squared, compared against squared distances
+    """
+    name: str
+    point1: str
+    point2: str
+    max_distance: float = 0.1
+    weight: float = 1.0
+    point1_idx: int = field(init=False, repr=False, compare=False)
+    point2_idx: int = field(init=False, repr=False, compare=False)
+    max_distance_sq: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "point1_idx", LANDMARK_INDICES.get(self.point1, -1))
+        object.__setattr__(self, "point2_idx", LANDMARK_INDICES.get(self.point2, -1))
+        object.__setattr__(self, "max_distance_sq", self.max_distance * self.max_distance)
+
+
+class PackedAngles(NamedTuple):
+    """A pose's angle definitions as parallel arrays, in required_angles order"""
+    points_idx: np.ndarray  # (A, 3) landmark indices of (point1, vertex, point2)
+    targets: np.ndarray  # (A,) target angles
+    tolerances: np.ndarray  # (A,)
+    weights: np.ndarray  # (A,)
+
+
+def pack_angles(angle_defs: Sequence[AngleDefinition]) -> PackedAngles:
+    """Pack angle definitions into arrays for vectorized scoring"""
+    points_idx = np.array(
+        [angle_def.points_idx for angle_def in angle_defs],
+        dtype=np.intp
+    ).reshape(-1, 3)
+    
+    return PackedAngles(
+        points_idx=points_idx,
+        targets=np.array([a.target_angle for a in angle_defs], dtype=PARAM_DTYPE),
+        tolerances=np.array([a.tolerance for a in angle_defs], dtype=PARAM_DTYPE),
+        weights=np.array([a.weight for a in angle_defs], dtype=PARAM_DTYPE)
+    )
+
+
+def landmark_mask(names: Sequence[str]) -> int:
+    """Bitmask with bit i set for each name that is landmark i; unknown names are ignored"""
+    mask = 0
+    for name in names:
+        landmark_idx = LANDMARK_INDICES.get(name)
+        if landmark_idx is not None:
+            mask |= 1 << landmark_idx
+    return mask
+
+
+@dataclass(frozen=True, slots=True)
+class PoseAngleConfig:
+    """
+    Angle configuration for a specific pose
+    
+    Attributes:
+        pose_name: Base name of the pose
+        view: Camera view: 'front' or 'side'
+        required_angles: List of angles to measure
+        required_keypoints: Only these keypoints will be checked
+        required_connections: Body part connections to check (e.g., hand holds foot)
+        packed: required_angles packed into arrays
+        keypoint_mask: Bit i set when landmark i is a required keypoint
+        angle_keypoints: Keypoints used by required_angles, in landmark order
+        angle_weight_total: Sum of the weights of required_angles
+    """
+    pose_name: str
+    view: str
+    required_angles: Sequence[AngleDefinition]
+    required_keypoints: Tuple[str, ...]
+    required_connections: Optional[Sequence[ConnectionDefinition]] = None
+    packed: PackedAngles = field(init=False, repr=False, compare=False)
+    keypoint_mask: int = field(init=False, repr=False, compare=False)
+    angle_keypoints: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    angle_weight_total: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Frozen dataclass: set the derived fields through object.__setattr__.
+        # Definitions are given as list literals; store them as tuples so a
+        # config is immutable all the way down and carries no list slack.
+        # tuple() returns shared tuples such as _FULL_BODY_KPS unchanged
+        object.__setattr__(self, "required_angles", tuple(self.required_angles))
+        object.__setattr__(self, "required_keypoints", tuple(self.required_keypoints))
+        if self.required_connections is not None:
+            object.__setattr__(self, "required_connections", tuple(self.required_connections))
+        object.__setattr__(self, "packed", pack_angles(self.required_angles))
+        object.__setattr__(self, "keypoint_mask", landmark_mask(self.required_keypoints))
+        angle_keypoints = tuple(sorted(
+            {p for angle_def in self.required_angles for p in angle_def.points},
+            key=lambda p: (LANDMARK_INDICES.get(p, len(LANDMARK_INDICES)), p)
+        ))
+        object.__setattr__(self, "angle_keypoints", _keypoint_sets.setdefault(angle_keypoints, angle_keypoints))
+        object.__setattr__(self, "angle_weight_total", sum(angle_def.weight for angle_def in self.required_angles))
+    
+    def has_all_keypoints(self, detected_mask: int) -> bool:
+        """Whether a bitmask of detected landmarks covers every required keypoint"""
+        return detected_mask & self.keypoint_mask == self.keypoint_mask
+
 
+# Structurally equal definitions recur across poses; keep one shared
+# instance of each (frozen dataclasses hash by value)
+_interned: Dict[object, object] = {}
 
-class AngleDefinition(BaseModel):
-    """Definition of a joint angle to measure"""
-    name: str = Field(..., description="Name of the angle (e.g., 'left_elbow')")
-    points: Tuple[str, str, str] = Field(..., description="(point1, vertex, point2) landmark names")
-    target_angle: float = Field(..., description="Expected angle in degrees")
-    tolerance: float = Field(default=15.0, description="Acceptable deviation in degrees")
-    weight: float = Field(default=1.0, description="Importance weight (higher = more important)")
 
+def _ad(*args, **kwargs) -> AngleDefinition:
+    """Build an AngleDefinition, reusing an equal one if already defined"""
+    angle_def = AngleDefinition(*args, **kwargs)
+    return _interned.setdefault(angle_def, angle_def)
 
-class ConnectionDefinition(BaseModel):
-    """Definition of a body part connection to check (e.g., hand holds foot)"""
-    name: str = Field(..., description="Name of the connection (e.g., 'Left hand holds right foot')")
-    point1: str = Field(..., description="First keypoint (e.g., 'left_wrist')")
-    point2: str = Field(..., description="Second keypoint (e.g., 'right_ankle')")
-    max_distance: float = Field(default=0.1, description="Maximum normalized distance to be considered 'connected'")
-    weight: float = Field(default=1.0, description="Importance weight")
 
+def _cd(*args, **kwargs) -> ConnectionDefinition:
+    """Build a ConnectionDefinition, reusing an equal one if already defined"""
+    conn_def = ConnectionDefinition(*args, **kwargs)
+    return _interned.setdefault(conn_def, conn_def)
 
-class PoseAngleConfig(BaseModel):
-    """Angle configuration for a specific pose"""
-    pose_name: str = Field(..., description="Base name of the pose")
-    view: str = Field(..., description="Camera view: 'front' or 'side'")
-    required_angles: List[AngleDefinition] = Field(..., description="List of angles to measure")
-    required_keypoints: List[str] = Field(..., description="Only these keypoints will be checked")
-    required_connections: Optional[List[ConnectionDefinition]] = Field(default=None, description="Body part connections to check (e.g., hand holds foot)")
+
+# Most connections are "hand holds X" checks sharing one reach and weight
+_HOLD_MAX_DISTANCE = 0.35  # normalized units
+_HOLD_WEIGHT = 2.0
+
+
+def _hold(name: str, point1: str, point2: str) -> ConnectionDefinition:
+    """A connection with the usual hold reach and weight"""
+    return _cd(name=name, point1=point1, point2=point2, max_distance=_HOLD_MAX_DISTANCE, weight=_HOLD_WEIGHT)
+
+
+# Short constructor name keeps the definitions below compact
+_pc = PoseAngleConfig
+
+
+# Keypoints checked for every pose
+_FULL_BODY_KPS: Tuple[str, ...] = (
+    "nose", "left_shoulder", "right_shoulder",
+    "left_elbow", "right_elbow",
+    "left_wrist", "right_wrist",
+    "left_hip", "right_hip",
+    "left_knee", "right_knee",
+    "left_ankle", "right_ankle"
+)
+
+# (point1, vertex, point2) triplets measured by most poses
+_LEFT_ARM = ("left_shoulder", "left_elbow", "left_wrist")
+_RIGHT_ARM = ("right_shoulder", "right_elbow", "right_wrist")
+_LEFT_LEG = ("left_hip", "left_knee", "left_ankle")
+_RIGHT_LEG = ("right_hip", "right_knee", "right_ankle")
+_RIGHT_SIDE_CURVE = ("right_shoulder", "right_hip", "right_knee")
+
+# Connections shared by several poses (names are shown to the user as-is)
+_RIGHT_HAND_HOLDS_RIGHT_LEG = _hold("right hand holds right leg", "right_wrist", "right_ankle")
+_LEFT_HAND_HOLDS_LEFT_LEG = _hold("left hand holds left leg", "left_wrist", "left_ankle")
+_RIGHT_HAND_HOLDS_LEFT_LEG = _hold("right hand holds left leg", "right_wrist", "left_ankle")
+_LEFT_HAND_HOLDS_LEFT_FOOT = _hold("Left hand holds left foot", "left_wrist", "left_ankle")
+_RIGHT_HAND_HOLDS_RIGHT_FOOT = _hold("Right hand holds right foot", "right_wrist", "right_ankle")
+_LEFT_HAND_HOLDS_RIGHT_FOOT = _hold("Left hand holds right foot", "left_wrist", "right_ankle")
+_RIGHT_HAND_HOLDS_LEFT_FOOT = _hold("Right hand holds left foot", "right_wrist", "left_ankle")
+_RIGHT_HAND_HOLDS_LEFT_HAND = _hold("right hand holds left hand", "right_wrist", "left_wrist")
+
+_HANDS_HOLD_SAME_SIDE_LEGS = (_RIGHT_HAND_HOLDS_RIGHT_LEG, _LEFT_HAND_HOLDS_LEFT_LEG)
+_HANDS_HOLD_SAME_SIDE_FEET = (_LEFT_HAND_HOLDS_LEFT_FOOT, _RIGHT_HAND_HOLDS_RIGHT_FOOT)
+_HANDS_HOLD_OPPOSITE_FEET = (_LEFT_HAND_HOLDS_RIGHT_FOOT, _RIGHT_HAND_HOLDS_LEFT_FOOT)
+_HANDS_HOLD_LEFT_LEG = (_RIGHT_HAND_HOLDS_LEFT_LEG, _LEFT_HAND_HOLDS_LEFT_LEG)
+_HANDS_CLASPED = (_RIGHT_HAND_HOLDS_LEFT_HAND,)
 
 
 # Define angles for each pose
 POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     
     # Tree Pose (Front View)
-    "Akarna_Dhanurasana_front": PoseAngleConfig(
+    "Akarna_Dhanurasana_front": _pc(
         pose_name="Akarna_Dhanurasana_",
         view="front",
-        required_keypoints=[
-            "nose", "left_shoulder", "right_shoulder",
-            "left_elbow", "right_elbow",
-            "left_wrist", "right_wrist",
-            "left_hip", "right_hip",
-            "left_knee", "right_knee",
-            "left_ankle", "right_ankle"
-        ],
-        required_connections=[
-            ConnectionDefinition(
-                name="Left hand holds right foot",
-                point1="left_wrist",
-                point2="right_ankle",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
-            ConnectionDefinition(
-                name="Right hand holds left foot",
-                point1="right_wrist",
-                point2="left_ankle",
-                max_distance=0.35,
-                weight=2.0
-            )
-        ],
+        required_keypoints=_FULL_BODY_KPS,
+        required_connections=_HANDS_HOLD_OPPOSITE_FEET,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="Standing Leg (Right Knee)",
-                points=("right_hip", "right_knee", "right_ankle"),
+                points=_RIGHT_LEG,
                 target_angle=56.2,  # Straight standing leg
                 tolerance=25.0,
                 weight=5.0  # Most critical
             ),
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=("right_shoulder", "right_elbow", "right_wrist"),
+                points=_RIGHT_ARM,
                 target_angle=173.9,
                 tolerance=20.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=("left_shoulder", "left_elbow", "left_wrist"),  # TODO: Update with actual keypoint names
+                points=_LEFT_ARM,
                 target_angle=39.3,
                 tolerance=25.0,
                 weight=2.0
@@ -91,56 +278,42 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
         ]
     ),
 
-     "Boat_Pose_or_Paripurna_Navasana__front": PoseAngleConfig(
+     "Boat_Pose_or_Paripurna_Navasana__front": _pc(
         pose_name="Boat_Pose_or_Paripurna_Navasana__",
-        view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        view="front",
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=("left_shoulder", "left_elbow", "left_wrist"),
+                points=_LEFT_ARM,
                 target_angle=175.8,
                 tolerance=25.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=("left_hip", "left_knee", "left_ankle"),
+                points=_LEFT_LEG,
                 target_angle=179.7,
                 tolerance=25.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=("right_hip", "right_knee", "right_ankle"),
+                points=_RIGHT_LEG,
                 target_angle=179.8,
                 tolerance=25.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=("right_shoulder", "right_elbow", "right_wrist"),
+                points=_RIGHT_ARM,
                 target_angle=169.2,
                 tolerance=25.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hip",
-                points=("left_hip", "left_knee", "left_ankle"),
+                points=_LEFT_LEG,
                 target_angle=83.5,
                 tolerance=25.0,
                 weight=5.0
@@ -153,65 +326,36 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
 
 
     # Bound_Angle_Pose_or_Baddha_Konasana__image_179 (Front View)
-    "Bound_Angle_Pose_or_Baddha_Konasana__front": PoseAngleConfig(
+    "Bound_Angle_Pose_or_Baddha_Konasana__front": _pc(
         pose_name="Bound_Angle_Pose_or_Baddha_Konasana__",
         view="front",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
-        required_connections=[
-            ConnectionDefinition(
-                name="Left hand holds right foot",
-                point1="left_wrist",
-                point2="right_ankle",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
-            ConnectionDefinition(
-                name="Right hand holds left foot",
-                point1="right_wrist",
-                point2="left_ankle",
-                max_distance=0.35,
-                weight=2.0
-            )
-        ],
+        required_keypoints=_FULL_BODY_KPS,
+        required_connections=_HANDS_HOLD_OPPOSITE_FEET,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=("right_shoulder", "right_elbow", "right_wrist"),
+                points=_RIGHT_ARM,
                 target_angle=175.4,
                 tolerance=20.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=("left_shoulder", "left_elbow", "left_wrist"),
+                points=_LEFT_ARM,
                 target_angle=178.4,
                 tolerance=20.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=("right_hip", "right_knee", "right_ankle"),
+                points=_RIGHT_LEG,
                 target_angle=16.9,
                 tolerance=25.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=("left_hip", "left_knee", "left_ankle"),
+                points=_LEFT_LEG,
                 target_angle=13.2,
                 tolerance=25.0,
                 weight=4.0
@@ -220,65 +364,36 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Bow_Pose_or_Dhanurasana__ (Side View)
-    "Bow_Pose_or_Dhanurasana__side": PoseAngleConfig(
+    "Bow_Pose_or_Dhanurasana__side": _pc(
         pose_name="Bow_Pose_or_Dhanurasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
-          required_connections=[
-            ConnectionDefinition(
-                name="Left hand holds left foot",
-                point1="left_wrist",
-                point2="left_ankle",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
-            ConnectionDefinition(
-                name="Right hand holds right foot",
-                point1="right_wrist",
-                point2="right_ankle",
-                max_distance=0.35,
-                weight=2.0
-            )
-        ],
+        required_keypoints=_FULL_BODY_KPS,
+          required_connections=_HANDS_HOLD_SAME_SIDE_FEET,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=169.9,
                 tolerance=20.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=168.1,
                 tolerance=20.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=85.7,
                 tolerance=25.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=95.4,
                 tolerance=25.0,
                 weight=4.0
@@ -287,65 +402,36 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Bridge_Pose_or_Setu_Bandha_Sarvangasana__ (Side View)
-    "Bridge_Pose_or_Setu_Bandha_Sarvangasana__front": PoseAngleConfig(
+    "Bridge_Pose_or_Setu_Bandha_Sarvangasana__front": _pc(
         pose_name="Bridge_Pose_or_Setu_Bandha_Sarvangasana__",
         view="front",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
-        required_connections=[
-            ConnectionDefinition(
-                name="Left hand holds left foot",
-                point1="left_wrist",
-                point2="left_ankle",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
-            ConnectionDefinition(
-                name="Right hand holds right foot",
-                point1="right_wrist",
-                point2="right_ankle",
-                max_distance=0.35,
-                weight=2.0
-            )
-        ],
+        required_keypoints=_FULL_BODY_KPS,
+        required_connections=_HANDS_HOLD_SAME_SIDE_FEET,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=63.5,
                 tolerance=20.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=61.1,
                 tolerance=20.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=177.8,
                 tolerance=20.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=176.0,
                 tolerance=20.0,
                 weight=2.0
@@ -354,65 +440,36 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Camel_Pose_or_Ustrasana__ (Side View)
-    "Camel_Pose_or_Ustrasana__side": PoseAngleConfig(
+    "Camel_Pose_or_Ustrasana__side": _pc(
         pose_name="Camel_Pose_or_Ustrasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
-                required_connections=[
-            ConnectionDefinition(
-                name="Left hand holds left foot",
-                point1="left_wrist",
-                point2="left_ankle",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
-            ConnectionDefinition(
-                name="Right hand holds right foot",
-                point1="right_wrist",
-                point2="right_ankle",
-                max_distance=0.35,
-                weight=2.0
-            )
-        ],
+        required_keypoints=_FULL_BODY_KPS,
+                required_connections=_HANDS_HOLD_SAME_SIDE_FEET,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=171.7,
                 tolerance=20.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=169.4,
                 tolerance=20.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=93.2,
                 tolerance=20.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=88.0,
                 tolerance=25.0,
                 weight=4.0
@@ -421,56 +478,42 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Cat_Cow_Pose_or_Marjaryasana__ (Side View)
-    "Cat_Cow_Pose_or_Marjaryasana__side": PoseAngleConfig(
+    "Cat_Cow_Pose_or_Marjaryasana__side": _pc(
         pose_name="Cat_Cow_Pose_or_Marjaryasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=179.8,
                 tolerance=25.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=179.0,
                 tolerance=20.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=105.4,
                 tolerance=25.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=103.1,
                 tolerance=25.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="shoulder",
-                points=("point1_name", "vertex_name", "point2_name"),  # TODO: Update with actual keypoint names
+                points=('right_elbow', 'right_shoulder', 'right_hip'),
                 target_angle=98.9,
                 tolerance=30.0,
                 weight=3.0
@@ -479,56 +522,42 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Chair_Pose_or_Utkatasana__ (Side View)
-    "Chair_Pose_or_Utkatasana__side": PoseAngleConfig(
+    "Chair_Pose_or_Utkatasana__side": _pc(
         pose_name="Chair_Pose_or_Utkatasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=90.5,
                 tolerance=25.0,
                 weight=2.0
             ),
-            AngleDefinition(   
+            _ad(   
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=92.8,
                 tolerance=25.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=177.0,
                 tolerance=25.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=("left_shoulder", "left_elbow", "left_wrist"),  # TODO: Update with actual keypoint names
+                points=_LEFT_ARM,
                 target_angle=179.4,
                 tolerance=25.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="shoulder",
-                points=("point1_name", "vertex_name", "point2_name"),  # TODO: Update with actual keypoint names
+                points=('left_shoulder', 'left_hip', 'left_knee'),
                 target_angle=70.7,
                 tolerance=30.0,
                 weight=4.0
@@ -537,49 +566,35 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Child_Pose_or_Balasana__ (Side View)
-    "Child_Pose_or_Balasana__side": PoseAngleConfig(
+    "Child_Pose_or_Balasana__side": _pc(
         pose_name="Child_Pose_or_Balasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=165.8,
                 tolerance=20.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=172.5,
                 tolerance=20.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=40.3,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=29.3,
                 tolerance=30.0,
                 weight=4.0
@@ -588,49 +603,35 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Cobra_Pose_or_Bhujangasana__ (Side View)
-    "Cobra_Pose_or_Bhujangasana__side": PoseAngleConfig(
+    "Cobra_Pose_or_Bhujangasana__side": _pc(
         pose_name="Cobra_Pose_or_Bhujangasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=171.9,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=167.9,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=174.3,
                 tolerance=25.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=176.7,
                 tolerance=25.0,
                 weight=4.0
@@ -639,33 +640,19 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Cockerel_Pose__ (Front View)
-    "Cockerel_Pose_front": PoseAngleConfig(
+    "Cockerel_Pose_front": _pc(
         pose_name="Cockerel_Pose_",
         view="front",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
          required_connections=[
-            ConnectionDefinition(
+            _cd(
                 name="Left hand holds left foot",
                 point1="left_wrist",
                 point2="left_ankle",
                 max_distance=0.50,  # 15% of normalized space
                 weight=2.0
             ),
-            ConnectionDefinition(
+            _cd(
                 name="Right hand holds right foot",
                 point1="right_wrist",
                 point2="right_ankle",
@@ -674,30 +661,30 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
             )
         ],
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=176.1,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=180.0,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=15.3,
                 tolerance=30.0,
                 weight=5.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=7.2,
                 tolerance=30.0,
                 weight=5.0
@@ -706,49 +693,35 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Corpse_Pose_or_Savasana__ (Side View)
-    "Corpse_Pose_or_Savasana__side": PoseAngleConfig(
+    "Corpse_Pose_or_Savasana__side": _pc(
         pose_name="Corpse_Pose_or_Savasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=175.1,
                 tolerance=25.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=177.4,
                 tolerance=25.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=173.4,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=179.1,
                 tolerance=25.0,
                 weight=3.0
@@ -757,58 +730,38 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Cow_Face_Pose_or_Gomukhasana__ (Front View)
-    "Cow_Face_Pose_or_Gomukhasana__front": PoseAngleConfig(
+    "Cow_Face_Pose_or_Gomukhasana__front": _pc(
         pose_name="Cow_Face_Pose_or_Gomukhasana__",
         view="front",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
          required_connections=[
-            ConnectionDefinition(
-                name="Left hand holds right hand",
-                point1="left_wrist",
-                point2="right_wrist",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
+            _hold("Left hand holds right hand", "left_wrist", "right_wrist"),
         ],
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=28.8,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=20.9,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=110.1,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=106.5,
                 tolerance=30.0,
                 weight=5.0
@@ -817,56 +770,42 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Crane_(Crow)_Pose_or_Bakasana__ (Side View)
-    "Crane_(Crow)_Pose_or_Bakasana__side": PoseAngleConfig(
+    "Crane_(Crow)_Pose_or_Bakasana__side": _pc(
         pose_name="Crane_(Crow)_Pose_or_Bakasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=126.0,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=130.3,
                 tolerance=25.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=45.0,
                 tolerance=30.0,
                 weight=5.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=45.5,
                 tolerance=30.0,
                 weight=5.0
             ),
-            AngleDefinition(
+            _ad(
                 name="curve",
-                points=("right_shoulder", "right_hip", "right_knee"), 
+                points=_RIGHT_SIDE_CURVE, 
                 target_angle=13.5,
                 tolerance=35.0,
                 weight=6.0
@@ -875,49 +814,35 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Dolphin_Plank_Pose_or_Makara_Adho_Mukha_Svanasana__ (Side View)
-    "Dolphin_Plank_Pose_or_Makara_Adho_Mukha_Svanasana__side": PoseAngleConfig(
+    "Dolphin_Plank_Pose_or_Makara_Adho_Mukha_Svanasana__side": _pc(
         pose_name="Dolphin_Plank_Pose_or_Makara_Adho_Mukha_Svanasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=96.8,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=89.2,
                 tolerance=25.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=175.0,
                 tolerance=25.0,
                 weight=5.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=178.9,
                 tolerance=30.0,
                 weight=2.0
@@ -926,56 +851,42 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Dolphin_Pose_or_Ardha_Pincha_Mayurasana__ (Side View)
-    "Dolphin_Pose_or_Ardha_Pincha_Mayurasana__side": PoseAngleConfig(
+    "Dolphin_Pose_or_Ardha_Pincha_Mayurasana__side": _pc(
         pose_name="Dolphin_Pose_or_Ardha_Pincha_Mayurasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=121.8,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=123.2,
                 tolerance=35.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=176.8,
                 tolerance=20.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=178.9,
                 tolerance=35.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="curve",
-                points=("right_shoulder", "right_hip", "right_knee"),  # TODO: Update with actual keypoint names
+                points=_RIGHT_SIDE_CURVE,
                 target_angle=71.5,
                 tolerance=20.0,
                 weight=5.0
@@ -984,56 +895,42 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Downward-Facing_Dog_pose_or_Adho_Mukha_Svanasana__ (Side View)
-    "Downward-Facing_Dog_pose_or_Adho_Mukha_Svanasana__side": PoseAngleConfig(
+    "Downward-Facing_Dog_pose_or_Adho_Mukha_Svanasana__side": _pc(
         pose_name="Downward-Facing_Dog_pose_or_Adho_Mukha_Svanasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=167.1,
                 tolerance=25.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=167.7,
                 tolerance=30.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=177.9,
                 tolerance=20.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=170.0,
                 tolerance=30.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="curve",
-                points=("right_shoulder", "right_hip", "right_knee"),  
+                points=_RIGHT_SIDE_CURVE,  
                 target_angle=73.6,
                 tolerance=20.0,
                 weight=5.0
@@ -1042,49 +939,35 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Eagle_Pose_or_Garudasana__ (Front View)
-    "Eagle_Pose_or_Garudasana__front": PoseAngleConfig(
+    "Eagle_Pose_or_Garudasana__front": _pc(
         pose_name="Eagle_Pose_or_Garudasana__",
         view="front",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=95.1,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=83.3,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=148.7,
                 tolerance=30.0,
                 weight=5.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=129.5,
                 tolerance=30.0,
                 weight=5.0
@@ -1093,49 +976,35 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Eight-Angle_Pose_or_Astavakrasana__ (Front View)
-    "Eight-Angle_Pose_or_Astavakrasana__front": PoseAngleConfig(
+    "Eight-Angle_Pose_or_Astavakrasana__front": _pc(
         pose_name="Eight-Angle_Pose_or_Astavakrasana__",
         view="front",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=101.2,
                 tolerance=30.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=113.8,
                 tolerance=30.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=176.6,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=172.3,
                 tolerance=30.0,
                 weight=5.0
@@ -1144,56 +1013,42 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Extended_Puppy_Pose_or_Uttana_Shishosana__ (Side View)
-    "Extended_Puppy_Pose_or_Uttana_Shishosana__side": PoseAngleConfig(
+    "Extended_Puppy_Pose_or_Uttana_Shishosana__side": _pc(
         pose_name="Extended_Puppy_Pose_or_Uttana_Shishosana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=164.8,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=159.8,
                 tolerance=25.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=78.1,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=79.4,
                 tolerance=30.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="curve",
-                points=("point1_name", "vertex_name", "point2_name"),  # TODO: Update with actual keypoint names
+                points=('left_shoulder', 'left_hip', 'left_knee'),
                 target_angle=62.3,
                 tolerance=30.0,
                 weight=5.0
@@ -1202,49 +1057,35 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Extended_Revolved_Side_Angle_Pose_or_Utthita_Parsvakonasana__ (Front View)
-    "Extended_Revolved_Side_Angle_Pose_or_Utthita_Parsvakonasana__front": PoseAngleConfig(
+    "Extended_Revolved_Side_Angle_Pose_or_Utthita_Parsvakonasana__front": _pc(
         pose_name="Extended_Revolved_Side_Angle_Pose_or_Utthita_Parsvakonasana__",
         view="front",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=136.5,
                 tolerance=30.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=169.4,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=102.7,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=174.9,
                 tolerance=30.0,
                 weight=4.0
@@ -1253,58 +1094,36 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Extended_Revolved_Triangle_Pose_or_Utthita_Trikonasana__ (Front View)
-    "Extended_Revolved_Triangle_Pose_or_Utthita_Trikonasana__front": PoseAngleConfig(
+    "Extended_Revolved_Triangle_Pose_or_Utthita_Trikonasana__front": _pc(
         pose_name="Extended_Revolved_Triangle_Pose_or_Utthita_Trikonasana__",
         view="front",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
-         required_connections=[
-            ConnectionDefinition(
-                name="right hand holds right leg",
-                point1="right_wrist",
-                point2="right_ankle",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
-        ],
+        required_keypoints=_FULL_BODY_KPS,
+         required_connections=(_RIGHT_HAND_HOLDS_RIGHT_LEG,),
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=163.3,
                 tolerance=20.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=174.6,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=179.6,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=173.4,
                 tolerance=30.0,
                 weight=4.0
@@ -1313,56 +1132,42 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Firefly_Pose_or_Tittibhasana__ (Side View)
-    "Firefly_Pose_or_Tittibhasana__side": PoseAngleConfig(
+    "Firefly_Pose_or_Tittibhasana__side": _pc(
         pose_name="Firefly_Pose_or_Tittibhasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=157.2,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=164.1,
                 tolerance=25.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=173.0,
                 tolerance=25.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=177.7,
                 tolerance=35.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="curve",
-                points=("right_shoulder", "right_hip", "right_knee"),  # TODO: Update with actual keypoint names
+                points=_RIGHT_SIDE_CURVE,
                 target_angle=21.1,
                 tolerance=35.0,
                 weight=5.0
@@ -1371,49 +1176,35 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Four-Limbed_Staff_Pose_or_Chaturanga_Dandasana__ (Side View)
-    "Four-Limbed_Staff_Pose_or_Chaturanga_Dandasana__side": PoseAngleConfig(
+    "Four-Limbed_Staff_Pose_or_Chaturanga_Dandasana__side": _pc(
         pose_name="Four-Limbed_Staff_Pose_or_Chaturanga_Dandasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=105.7,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=97.3,
                 tolerance=30.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=175.2,
                 tolerance=25.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=172.5,
                 tolerance=30.0,
                 weight=2.0
@@ -1422,72 +1213,46 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Frog_Pose_or_Bhekasana_ (Side View)
-    "Frog_Pose_or_Bhekasana_side": PoseAngleConfig(
+    "Frog_Pose_or_Bhekasana_side": _pc(
         pose_name="Frog_Pose_or_Bhekasana_",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_connections=[
-            ConnectionDefinition(
-                name="right hand holds right leg",
-                point1="right_wrist",
-                point2="right_ankle",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
-             ConnectionDefinition(
-                name="left hand holds left leg",
-                point1="leftr_wrist",
-                point2="left_ankle",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
+            _hold("right hand holds right leg", "right_wrist", "right_ankle"),
+            _hold("left hand holds left leg", "left_wrist", "left_ankle"),
         ],
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=82.1,
                 tolerance=30.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=78.9,
                 tolerance=35.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=21.1,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=22.0,
                 tolerance=35.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="curve",
-                points=("right_shoulder", "right_hip", "right_knee"),  # TODO: Update with actual keypoint names
+                points=_RIGHT_SIDE_CURVE,
                 target_angle=131.3,
                 tolerance=30.0,
                 weight=5.0
@@ -1496,49 +1261,35 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Garland_Pose_or_Malasana__ (Front View)
-    "Garland_Pose_or_Malasana__front": PoseAngleConfig(
+    "Garland_Pose_or_Malasana__front": _pc(
         pose_name="Garland_Pose_or_Malasana__",
         view="front",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=66.9,
                 tolerance=30.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=66.2,
                 tolerance=30.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=35.5,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=38.4,
                 tolerance=30.0,
                 weight=4.0
@@ -1547,65 +1298,45 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Gate_Pose_or_Parighasana__ (Front View)
-    "Gate_Pose_or_Parighasana__front": PoseAngleConfig(
+    "Gate_Pose_or_Parighasana__front": _pc(
         pose_name="Gate_Pose_or_Parighasana__",
         view="front",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
           required_connections=[
-            ConnectionDefinition(
-                name="right hand holds right leg",
-                point1="right_wrist",
-                point2="right_knee",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
+            _hold("right hand holds right leg", "right_wrist", "right_knee"),
         ],
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=172.2,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=169.1,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=164.5,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=62.0,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="curve",
-                points=("right_shoulder", "right_hip", "right_knee"),  # TODO: Update with actual keypoint names
+                points=_RIGHT_SIDE_CURVE,
                 target_angle=92.0,
                 tolerance=35.0,
                 weight=5.0
@@ -1614,49 +1345,35 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Half_Lord_of_the_Fishes_Pose_or_Ardha_Matsyendrasana__ (Front View)
-    "Half_Lord_of_the_Fishes_Pose_or_Ardha_Matsyendrasana__front": PoseAngleConfig(
+    "Half_Lord_of_the_Fishes_Pose_or_Ardha_Matsyendrasana__front": _pc(
         pose_name="Half_Lord_of_the_Fishes_Pose_or_Ardha_Matsyendrasana__",
         view="front",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=176.6,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=50.0,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=89.7,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=22.2,
                 tolerance=30.0,
                 weight=4.0
@@ -1665,49 +1382,35 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Half_Moon_Pose_or_Ardha_Chandrasana__ (Side View)
-    "Half_Moon_Pose_or_Ardha_Chandrasana__side": PoseAngleConfig(
+    "Half_Moon_Pose_or_Ardha_Chandrasana__side": _pc(
         pose_name="Half_Moon_Pose_or_Ardha_Chandrasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=175.6,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=173.1,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=179.0,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=174.6,
                 tolerance=30.0,
                 weight=4.0
@@ -1716,56 +1419,42 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Handstand_pose_or_Adho_Mukha_Vrksasana__ (Side View)
-    "Handstand_pose_or_Adho_Mukha_Vrksasana__side": PoseAngleConfig(
+    "Handstand_pose_or_Adho_Mukha_Vrksasana__side": _pc(
         pose_name="Handstand_pose_or_Adho_Mukha_Vrksasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=172.2,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=175.5,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=177.0,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=176.5,
                 tolerance=30.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="curve",
-                points=("right_shoulder", "right_hip", "right_knee"),  # TODO: Update with actual keypoint names
+                points=_RIGHT_SIDE_CURVE,
                 target_angle=177.7,
                 tolerance=30.0,
                 weight=5.0
@@ -1774,72 +1463,43 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Happy_Baby_Pose_or_Ananda_Balasana__ (Side View)
-    "Happy_Baby_Pose_or_Ananda_Balasana__side": PoseAngleConfig(
+    "Happy_Baby_Pose_or_Ananda_Balasana__side": _pc(
         pose_name="Happy_Baby_Pose_or_Ananda_Balasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
-        required_connections=[
-            ConnectionDefinition(
-                name="right hand holds right leg",
-                point1="right_wrist",
-                point2="right_ankle",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
-            ConnectionDefinition(
-                name="left hand holds left leg",
-                point1="left_wrist",
-                point2="left_ankle",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
-        ],
+        required_keypoints=_FULL_BODY_KPS,
+        required_connections=_HANDS_HOLD_SAME_SIDE_LEGS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=178.9,
                 tolerance=30.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=176.3,
                 tolerance=30.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=94.8,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=86.8,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="curve",
-                points=("right_shoulder", "right_hip", "right_knee"),  # TODO: Update with actual keypoint names
+                points=_RIGHT_SIDE_CURVE,
                 target_angle=19.9,
                 tolerance=35.0,
                 weight=5.0
@@ -1848,56 +1508,42 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Heron_Pose_or_Krounchasana__ (Side View)
-    "Heron_Pose_or_Krounchasana__side": PoseAngleConfig(
+    "Heron_Pose_or_Krounchasana__side": _pc(
         pose_name="Heron_Pose_or_Krounchasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=162.2,
                 tolerance=30.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=161.4,
                 tolerance=30.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=14.0,
                 tolerance=35.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=176.1,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="curve",
-                points=("right_shoulder", "right_hip", "right_knee"),  # TODO: Update with actual keypoint names
+                points=_RIGHT_SIDE_CURVE,
                 target_angle=110.3,
                 tolerance=35.0,
                 weight=5.0
@@ -1906,65 +1552,43 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Intense_Side_Stretch_Pose_or_Parsvottanasana__ (Side View)
-    "Intense_Side_Stretch_Pose_or_Parsvottanasana__side": PoseAngleConfig(
+    "Intense_Side_Stretch_Pose_or_Parsvottanasana__side": _pc(
         pose_name="Intense_Side_Stretch_Pose_or_Parsvottanasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
-            required_connections=[
-            ConnectionDefinition(
-                name="right hand holds left hand",
-                point1="right_wrist",
-                point2="left_wrist",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
-        ],
+        required_keypoints=_FULL_BODY_KPS,
+            required_connections=_HANDS_CLASPED,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=107.0,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=23.2,
                 tolerance=30.0,
                 weight=1.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=177.7,
                 tolerance=25.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=179.7,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="curve",
-                points=("point1_name", "vertex_name", "point2_name"),  # TODO: Update with actual keypoint names
+                points=('left_shoulder', 'left_hip', 'right_knee'),
                 target_angle=56.8,
                 tolerance=30.0,
                 weight=5.0
@@ -1973,65 +1597,39 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Locust_Pose_or_Salabhasana__ (Side View)
-    "Locust_Pose_or_Salabhasana__side": PoseAngleConfig(
+    "Locust_Pose_or_Salabhasana__side": _pc(
         pose_name="Locust_Pose_or_Salabhasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_connections=[
-            ConnectionDefinition(
-                name="right hand holds left hand",
-                point1="right_wrist",
-                point2="left_wrist",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
-            ConnectionDefinition(
-                name="right leg holds left leg",
-                point1="right_ankle",
-                point2="left_ankle",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
+            _hold("right hand holds left hand", "right_wrist", "left_wrist"),
+            _hold("right leg holds left leg", "right_ankle", "left_ankle"),
         ],
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=174.5,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=176.0,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=151.5,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=160.9,
                 tolerance=30.0,
                 weight=4.0
@@ -2040,72 +1638,43 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Lord_of_the_Dance_Pose_or_Natarajasana__ (Side View)
-    "Lord_of_the_Dance_Pose_or_Natarajasana__side": PoseAngleConfig(
+    "Lord_of_the_Dance_Pose_or_Natarajasana__side": _pc(
         pose_name="Lord_of_the_Dance_Pose_or_Natarajasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
-        required_connections=[
-            ConnectionDefinition(
-                name="right hand holds left leg",
-                point1="right_wrist",
-                point2="left_ankle",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
-            ConnectionDefinition(
-                name="left hand holds left leg",
-                point1="left_wrist",
-                point2="left_ankle",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
-        ],
+        required_keypoints=_FULL_BODY_KPS,
+        required_connections=_HANDS_HOLD_LEFT_LEG,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=109.8,
                 tolerance=30.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=125.2,
                 tolerance=30.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=175.1,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=85.8,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="curve",
-                points=("right_shoulder", "right_hip", "right_knee"),  # TODO: Update with actual keypoint names
+                points=_RIGHT_SIDE_CURVE,
                 target_angle=100.7,
                 tolerance=30.0,
                 weight=5.0
@@ -2114,58 +1683,36 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Low_Lunge_pose_or_Anjaneyasana__ (Side View)
-    "Low_Lunge_pose_or_Anjaneyasana__side": PoseAngleConfig(
+    "Low_Lunge_pose_or_Anjaneyasana__side": _pc(
         pose_name="Low_Lunge_pose_or_Anjaneyasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
-          required_connections=[
-            ConnectionDefinition(
-                name="right hand holds left hand",
-                point1="right_wrist",
-                point2="left_wrist",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
-        ],
+        required_keypoints=_FULL_BODY_KPS,
+          required_connections=_HANDS_CLASPED,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=160.1,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=168.5,
                 tolerance=25.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=130.5,
                 tolerance=25.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=80.5,
                 tolerance=25.0,
                 weight=4.0
@@ -2174,49 +1721,35 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Peacock_Pose_or_Mayurasana__ (Front View)
-    "Peacock_Pose_or_Mayurasana__front": PoseAngleConfig(
+    "Peacock_Pose_or_Mayurasana__front": _pc(
         pose_name="Peacock_Pose_or_Mayurasana__",
         view="front",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=81.8,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=90.7,
                 tolerance=25.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=169.2,
                 tolerance=25.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=159.2,
                 tolerance=25.0,
                 weight=4.0
@@ -2225,72 +1758,43 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Pigeon_Pose_or_Kapotasana__ (Side View)
-    "Pigeon_Pose_or_Kapotasana__side": PoseAngleConfig(
+    "Pigeon_Pose_or_Kapotasana__side": _pc(
         pose_name="Pigeon_Pose_or_Kapotasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
-        required_connections=[
-            ConnectionDefinition(
-                name="right hand holds right leg",
-                point1="right_wrist",
-                point2="right_ankle",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
-            ConnectionDefinition(
-                name="left hand holds left leg",
-                point1="left_wrist",
-                point2="left_ankle",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
-        ],
+        required_keypoints=_FULL_BODY_KPS,
+        required_connections=_HANDS_HOLD_SAME_SIDE_LEGS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=156.4,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=140.2,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=110.7,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=104.7,
                 tolerance=30.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="curve",
-                points=("right_shoulder", "right_hip", "right_knee"),  # TODO: Update with actual keypoint names
+                points=_RIGHT_SIDE_CURVE,
                 target_angle=92.6,
                 tolerance=35.0,
                 weight=5.0
@@ -2299,49 +1803,35 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Plank_Pose_or_Kumbhakasana__ (Side View)
-    "Plank_Pose_or_Kumbhakasana__side": PoseAngleConfig(
+    "Plank_Pose_or_Kumbhakasana__side": _pc(
         pose_name="Plank_Pose_or_Kumbhakasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=170.2,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=176.7,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=172.0,
                 tolerance=25.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=170.8,
                 tolerance=25.0,
                 weight=3.0
@@ -2350,56 +1840,42 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Plow_Pose_or_Halasana__ (Side View)
-    "Plow_Pose_or_Halasana__side": PoseAngleConfig(
+    "Plow_Pose_or_Halasana__side": _pc(
         pose_name="Plow_Pose_or_Halasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=171.0,
                 tolerance=30.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=179.0,
                 tolerance=25.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=173.0,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=174.4,
                 tolerance=30.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="curve",
-                points=("right_shoulder", "right_hip", "right_knee"),  # TODO: Update with actual keypoint names
+                points=_RIGHT_SIDE_CURVE,
                 target_angle=53.8,
                 tolerance=35.0,
                 weight=5.0
@@ -2408,72 +1884,43 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Rajakapotasana_ (Side View)
-    "Rajakapotasana_side": PoseAngleConfig(
+    "Rajakapotasana_side": _pc(
         pose_name="Rajakapotasana_",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
-        required_connections=[
-            ConnectionDefinition(
-                name="right hand holds left leg",
-                point1="right_wrist",
-                point2="left_ankle",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
-            ConnectionDefinition(
-                name="left hand holds left leg",
-                point1="left_wrist",
-                point2="left_ankle",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
-        ],
+        required_keypoints=_FULL_BODY_KPS,
+        required_connections=_HANDS_HOLD_LEFT_LEG,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=70.5,
                 tolerance=30.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=60.1,
                 tolerance=30.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=179.1,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=65.1,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="curve",
-                points=("right_shoulder", "right_hip", "right_knee"),  # TODO: Update with actual keypoint names
+                points=_RIGHT_SIDE_CURVE,
                 target_angle=96.4,
                 tolerance=35.0,
                 weight=5.0
@@ -2482,49 +1929,35 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Reclining_Hand-to-Big-Toe_Pose_or_Supta_Padangusthasana__ (Side View)
-    "Reclining_Hand-to-Big-Toe_Pose_or_Supta_Padangusthasana__side": PoseAngleConfig(
+    "Reclining_Hand-to-Big-Toe_Pose_or_Supta_Padangusthasana__side": _pc(
         pose_name="Reclining_Hand-to-Big-Toe_Pose_or_Supta_Padangusthasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=88.0,
                 tolerance=20.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=96.8,
                 tolerance=30.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=177.5,
                 tolerance=25.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=177.5,
                 tolerance=30.0,
                 weight=3.0
@@ -2533,72 +1966,46 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Revolved_Head-to-Knee_Pose_or_Parivrtta_Janu_Sirsasana__ (Front View)
-    "Revolved_Head-to-Knee_Pose_or_Parivrtta_Janu_Sirsasana__front": PoseAngleConfig(
+    "Revolved_Head-to-Knee_Pose_or_Parivrtta_Janu_Sirsasana__front": _pc(
         pose_name="Revolved_Head-to-Knee_Pose_or_Parivrtta_Janu_Sirsasana__",
         view="front",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_connections=[
-            ConnectionDefinition(
-                name="left hand holds right leg",
-                point1="left_wrist",
-                point2="right_ankle",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
-            ConnectionDefinition(
-                name="right hand holds right leg",
-                point1="right_wrist",
-                point2="right_ankle",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
+            _hold("left hand holds right leg", "left_wrist", "right_ankle"),
+            _hold("right hand holds right leg", "right_wrist", "right_ankle"),
         ],
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=98.8,
                 tolerance=30.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=176.3,
                 tolerance=30.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=177.2,
                 tolerance=25.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=38.8,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="curve",
-                points=("right_shoulder", "right_hip", "right_knee"),  # TODO: Update with actual keypoint names
+                points=_RIGHT_SIDE_CURVE,
                 target_angle=21.4,
                 tolerance=40.0,
                 weight=4.0
@@ -2607,65 +2014,39 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Scale_Pose_or_Tolasana__ (Front View)
-    "Scale_Pose_or_Tolasana__front": PoseAngleConfig(
+    "Scale_Pose_or_Tolasana__front": _pc(
         pose_name="Scale_Pose_or_Tolasana__",
         view="front",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
          required_connections=[
-            ConnectionDefinition(
-                name="left leg near right hip",
-                point1="left_anke",
-                point2="right_hip",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
-            ConnectionDefinition(
-                name="right leg near left hip",
-                point1="right_ankle",
-                point2="left_hip",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
+            _hold("left leg near right hip", "left_ankle", "right_hip"),
+            _hold("right leg near left hip", "right_ankle", "left_hip"),
         ],
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=177.2,
                 tolerance=30.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=180.0,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=19.8,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=23.0,
                 tolerance=30.0,
                 weight=4.0
@@ -2674,56 +2055,42 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Scorpion_pose_or_vrischikasana_ (Side View)
-    "Scorpion_pose_or_vrischikasana_side": PoseAngleConfig(
+    "Scorpion_pose_or_vrischikasana_side": _pc(
         pose_name="Scorpion_pose_or_vrischikasana_",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=90.5,
                 tolerance=30.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=93.0,
                 tolerance=30.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=77.6,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=83.0,
                 tolerance=30.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="curve",
-                points=("right_shoulder", "right_hip", "right_knee"),  
+                points=_RIGHT_SIDE_CURVE,  
                 target_angle=104.4,
                 tolerance=35.0,
                 weight=5.0
@@ -2732,72 +2099,46 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Seated_Forward_Bend_pose_or_Paschimottanasana__ (Side View)
-    "Seated_Forward_Bend_pose_or_Paschimottanasana__side": PoseAngleConfig(
+    "Seated_Forward_Bend_pose_or_Paschimottanasana__side": _pc(
         pose_name="Seated_Forward_Bend_pose_or_Paschimottanasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
           required_connections=[
-            ConnectionDefinition(
-                name="left hand hold left leg",
-                point1="left_wrist",
-                point2="left_ankle",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
-            ConnectionDefinition(
-                name="right hand hold right leg",
-                point1="right_wrist",
-                point2="right_ankle",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
+            _hold("left hand hold left leg", "left_wrist", "left_ankle"),
+            _hold("right hand hold right leg", "right_wrist", "right_ankle"),
         ],
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=116.9,
                 tolerance=30.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=130.6,
                 tolerance=30.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=175.2,
                 tolerance=25.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=178.2,
                 tolerance=30.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="curve",
-                points=("right_shoulder", "right_hip", "right_knee"),  
+                points=_RIGHT_SIDE_CURVE,  
                 target_angle=45.2,
                 tolerance=30.0,
                 weight=5.0
@@ -2806,58 +2147,38 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Shoulder-Pressing_Pose_or_Bhujapidasana__ (Front View)
-    "Shoulder-Pressing_Pose_or_Bhujapidasana__front": PoseAngleConfig(
+    "Shoulder-Pressing_Pose_or_Bhujapidasana__front": _pc(
         pose_name="Shoulder-Pressing_Pose_or_Bhujapidasana__",
         view="front",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_connections=[
-            ConnectionDefinition(
-                name="left leg near right leg",
-                point1="left_ankle",
-                point2="right_ankle",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
+            _hold("left leg near right leg", "left_ankle", "right_ankle"),
         ],
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=159.9,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=168.9,
                 tolerance=30.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=17.3,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=18.5,
                 tolerance=30.0,
                 weight=4.0
@@ -2866,49 +2187,35 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Side_Crane_(Crow)_Pose_or_Parsva_Bakasana__ (Side View)
-    "Side_Crane_(Crow)_Pose_or_Parsva_Bakasana__side": PoseAngleConfig(
+    "Side_Crane_(Crow)_Pose_or_Parsva_Bakasana__side": _pc(
         pose_name="Side_Crane_(Crow)_Pose_or_Parsva_Bakasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=131.0,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=113.1,
                 tolerance=30.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=159.4,
                 tolerance=25.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=78.7,
                 tolerance=30.0,
                 weight=4.0
@@ -2917,49 +2224,35 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Side_Plank_Pose_or_Vasisthasana__ (Side View)
-    "Side_Plank_Pose_or_Vasisthasana__side": PoseAngleConfig(
+    "Side_Plank_Pose_or_Vasisthasana__side": _pc(
         pose_name="Side_Plank_Pose_or_Vasisthasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=174.2,
                 tolerance=20.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=172.8,
                 tolerance=20.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=179.1,
                 tolerance=25.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=178.1,
                 tolerance=25.0,
                 weight=4.0
@@ -2968,58 +2261,38 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Side-Reclining_Leg_Lift_pose_or_Anantasana__ (Side View)
-    "Side-Reclining_Leg_Lift_pose_or_Anantasana__side": PoseAngleConfig(
+    "Side-Reclining_Leg_Lift_pose_or_Anantasana__side": _pc(
         pose_name="Side-Reclining_Leg_Lift_pose_or_Anantasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
           required_connections=[
-            ConnectionDefinition(
-                name="left hand holds left leg",
-                point1="left_wrist",
-                point2="left_ankle",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
+            _hold("left hand holds left leg", "left_wrist", "left_ankle"),
         ],
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=36.9,
                 tolerance=30.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=176.1,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=179.3,
                 tolerance=25.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=179.7,
                 tolerance=25.0,
                 weight=4.0
@@ -3028,63 +2301,43 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Split pose_ (Front View)
-    "Split pose_front": PoseAngleConfig(
+    "Split pose_front": _pc(
         pose_name="Split pose_",
         view="front",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_connections=[
-            ConnectionDefinition(
-                name="left hand holds right hand",
-                point1="left_wrist",
-                point2="right_wrsit",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
+            _hold("left hand holds right hand", "left_wrist", "right_wrist"),
         ],
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=179.6,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=166.8,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=149.0,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=178.2,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="leg spacing",
                 points=("right_knee", "right_hip", "left_knee"), 
                 target_angle=170.5,
@@ -3095,56 +2348,42 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Staff_Pose_or_Dandasana__ (Side View)
-    "Staff_Pose_or_Dandasana__side": PoseAngleConfig(
+    "Staff_Pose_or_Dandasana__side": _pc(
         pose_name="Staff_Pose_or_Dandasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=176.5,
                 tolerance=20.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=179.7,
                 tolerance=30.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=176.9,
                 tolerance=25.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=177.1,
                 tolerance=25.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="curve",
-                points=("right_shoulder", "right_hip", "right_knee"),  
+                points=_RIGHT_SIDE_CURVE,  
                 target_angle=103.4,
                 tolerance=30.0,
                 weight=4.0
@@ -3153,58 +2392,36 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Standing_big_toe_hold_pose_or_Utthita_Padangusthasana_ (Front View)
-    "Standing_big_toe_hold_pose_or_Utthita_Padangusthasana_front": PoseAngleConfig(
+    "Standing_big_toe_hold_pose_or_Utthita_Padangusthasana_front": _pc(
         pose_name="Standing_big_toe_hold_pose_or_Utthita_Padangusthasana_",
         view="front",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
-          required_connections=[
-            ConnectionDefinition(
-                name="right hand holds right leg",
-                point1="right_wrist",
-                point2="right_ankle",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
-        ],
+        required_keypoints=_FULL_BODY_KPS,
+          required_connections=(_RIGHT_HAND_HOLDS_RIGHT_LEG,),
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=169.9,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=104.1,
                 tolerance=30.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=176.3,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=178.9,
                 tolerance=30.0,
                 weight=4.0
@@ -3213,72 +2430,43 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Standing_Forward_Bend_pose_or_Uttanasana__ (Side View)
-    "Standing_Forward_Bend_pose_or_Uttanasana__side": PoseAngleConfig(
+    "Standing_Forward_Bend_pose_or_Uttanasana__side": _pc(
         pose_name="Standing_Forward_Bend_pose_or_Uttanasana__",
         view="side",
-        required_keypoints=[  
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
-        required_connections=[
-            ConnectionDefinition(
-                name="right hand holds right leg",
-                point1="right_wrist",
-                point2="right_ankle",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
-            ConnectionDefinition(
-                name="left hand holds left leg",
-                point1="left_wrist",
-                point2="left_ankle",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
-        ],
+        required_keypoints=_FULL_BODY_KPS,
+        required_connections=_HANDS_HOLD_SAME_SIDE_LEGS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=164.8,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=166.8,
                 tolerance=30.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=166.1,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=169.4,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="curve",
-                points=("right_shoulder", "right_hip", "right_knee"),
+                points=_RIGHT_SIDE_CURVE,
                 target_angle=36.1,
                 tolerance=30.0,
                 weight=5.0
@@ -3287,56 +2475,42 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Standing_Split_pose_or_Urdhva_Prasarita_Eka_Padasana__ (Side View)
-    "Standing_Split_pose_or_Urdhva_Prasarita_Eka_Padasana__side": PoseAngleConfig(
+    "Standing_Split_pose_or_Urdhva_Prasarita_Eka_Padasana__side": _pc(
         pose_name="Standing_Split_pose_or_Urdhva_Prasarita_Eka_Padasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=163.0,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=144.9,
                 tolerance=25.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=177.0,
                 tolerance=25.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=169.7,
                 tolerance=25.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="curve",
-                points=("left_shoulder", "right_hip", "right_knee"),  # TODO: Update with actual keypoint names
+                points=("left_shoulder", "right_hip", "right_knee"),
                 target_angle=55.7,
                 tolerance=30.0,
                 weight=4.0
@@ -3345,49 +2519,35 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Supported_Headstand_pose_or_Salamba_Sirsasana__ (Side View)
-    "Supported_Headstand_pose_or_Salamba_Sirsasana__side": PoseAngleConfig(
+    "Supported_Headstand_pose_or_Salamba_Sirsasana__side": _pc(
         pose_name="Supported_Headstand_pose_or_Salamba_Sirsasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=65.0,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=70.0,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=178.6,
                 tolerance=25.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=176.6,
                 tolerance=25.0,
                 weight=4.0
@@ -3396,56 +2556,42 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Supported_Shoulderstand_pose_or_Salamba_Sarvangasana__ (Side View)
-    "Supported_Shoulderstand_pose_or_Salamba_Sarvangasana__side": PoseAngleConfig(
+    "Supported_Shoulderstand_pose_or_Salamba_Sarvangasana__side": _pc(
         pose_name="Supported_Shoulderstand_pose_or_Salamba_Sarvangasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=79.5,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=76.7,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=176.3,
                 tolerance=25.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=176.4,
                 tolerance=30.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="curve",
-                points=("right_shoulder", "right_hip", "right_knee"),  
+                points=_RIGHT_SIDE_CURVE,  
                 target_angle=133.8,
                 tolerance=30.0,
                 weight=4.0
@@ -3454,49 +2600,35 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Supta_Baddha_Konasana__ (Side View)
-    "Supta_Baddha_Konasana__side": PoseAngleConfig(
+    "Supta_Baddha_Konasana__side": _pc(
         pose_name="Supta_Baddha_Konasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=152.1,
                 tolerance=30.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=158.7,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=34.2,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=36.9,
                 tolerance=25.0,
                 weight=4.0
@@ -3505,49 +2637,35 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Supta_Virasana_Vajrasana_ (Side View)
-    "Supta_Virasana_Vajrasana_side": PoseAngleConfig(
+    "Supta_Virasana_Vajrasana_side": _pc(
         pose_name="Supta_Virasana_Vajrasana_",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=171.5,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=168.0,
                 tolerance=25.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=20.1,
                 tolerance=25.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=23.6,
                 tolerance=30.0,
                 weight=3.0
@@ -3556,49 +2674,35 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Tree_Pose_or_Vrksasana__ (Front View)
-    "Tree_Pose_or_Vrksasana__front": PoseAngleConfig(
+    "Tree_Pose_or_Vrksasana__front": _pc(
         pose_name="Tree_Pose_or_Vrksasana__",
         view="front",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=176.8,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=178.8,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=29.1,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=178.1,
                 tolerance=25.0,
                 weight=4.0
@@ -3607,56 +2711,42 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Upward_Bow_(Wheel)_Pose_or_Urdhva_Dhanurasana__ (Side View)
-    "Upward_Bow_(Wheel)_Pose_or_Urdhva_Dhanurasana__side": PoseAngleConfig(
+    "Upward_Bow_(Wheel)_Pose_or_Urdhva_Dhanurasana__side": _pc(
         pose_name="Upward_Bow_(Wheel)_Pose_or_Urdhva_Dhanurasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=153.7,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=156.1,
                 tolerance=30.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=115.0,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=115.6,
                 tolerance=30.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="curve",
-                points=("left_shoulder", "left_hip", "left_knee"),  # TODO: Update with actual keypoint names
+                points=("left_shoulder", "left_hip", "left_knee"),
                 target_angle=128.5,
                 tolerance=30.0,
                 weight=5.0
@@ -3665,66 +2755,46 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Upward_Facing_Two-Foot_Staff_Pose_or_Dwi_Pada_Viparita_Dandasana__ (Side View)
-    "Upward_Facing_Two-Foot_Staff_Pose_or_Dwi_Pada_Viparita_Dandasana__side": PoseAngleConfig(
+    "Upward_Facing_Two-Foot_Staff_Pose_or_Dwi_Pada_Viparita_Dandasana__side": _pc(
         pose_name="Upward_Facing_Two-Foot_Staff_Pose_or_Dwi_Pada_Viparita_Dandasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
          required_connections=[
-            ConnectionDefinition(
-                name="right hand holds left hand ",
-                point1="right_wrist",
-                point2="left_wrist",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
+            _hold("right hand holds left hand ", "right_wrist", "left_wrist"),
            
         ],
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=42.1,
                 tolerance=30.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=42.7,
                 tolerance=30.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=95.2,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=86.8,
                 tolerance=30.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="curve",
-                points=("right_shoulder", "right_hip", "right_knee"),  # TODO: Update with actual keypoint names
+                points=_RIGHT_SIDE_CURVE,
                 target_angle=134.2,
                 tolerance=30.0,
                 weight=4.0
@@ -3733,49 +2803,35 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Upward_Plank_Pose_or_Purvottanasana__ (Side View)
-    "Upward_Plank_Pose_or_Purvottanasana__side": PoseAngleConfig(
+    "Upward_Plank_Pose_or_Purvottanasana__side": _pc(
         pose_name="Upward_Plank_Pose_or_Purvottanasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=172.4,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=173.2,
                 tolerance=30.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=177.1,
                 tolerance=25.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=179.5,
                 tolerance=30.0,
                 weight=3.0
@@ -3784,56 +2840,42 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # viparita_virabhadrasana_or_reverse_warrior_pose_ (Front View)
-    "viparita_virabhadrasana_or_reverse_warrior_pose_front": PoseAngleConfig(
+    "viparita_virabhadrasana_or_reverse_warrior_pose_front": _pc(
         pose_name="viparita_virabhadrasana_or_reverse_warrior_pose_",
         view="front",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=150.5,
                 tolerance=30.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=173.1,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=103.3,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=168.0,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="curve",
-                points=("right_shoulder", "right_hip", "right_knee"),  # TODO: Update with actual keypoint names
+                points=_RIGHT_SIDE_CURVE,
                 target_angle=122.7,
                 tolerance=30.0,
                 weight=4.0
@@ -3842,56 +2884,42 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Warrior_I_Pose_or_Virabhadrasana_I__ (Side View)
-    "Warrior_I_Pose_or_Virabhadrasana_I__side": PoseAngleConfig(
+    "Warrior_I_Pose_or_Virabhadrasana_I__side": _pc(
         pose_name="Warrior_I_Pose_or_Virabhadrasana_I__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=166.7,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=167.0,
                 tolerance=25.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=166.8,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=97.8,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="curve",
-                points=("right_shoulder", "right_hip", "right_knee"),  # TODO: Update with actual keypoint names
+                points=_RIGHT_SIDE_CURVE,
                 target_angle=134.4,
                 tolerance=30.0,
                 weight=4.0
@@ -3900,56 +2928,42 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Warrior_II_Pose_or_Virabhadrasana_II__ (Side View)
-    "Warrior_II_Pose_or_Virabhadrasana_II__side": PoseAngleConfig(
+    "Warrior_II_Pose_or_Virabhadrasana_II__side": _pc(
         pose_name="Warrior_II_Pose_or_Virabhadrasana_II__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=172.7,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=176.3,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=120.7,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=173.7,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="curve",
-                points=("right_shoulder", "right_hip", "right_knee"),  # TODO: Update with actual keypoint names
+                points=_RIGHT_SIDE_CURVE,
                 target_angle=108.1,
                 tolerance=30.0,
                 weight=4.0
@@ -3958,65 +2972,45 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Warrior_III_Pose_or_Virabhadrasana_III__ (Side View)
-    "Warrior_III_Pose_or_Virabhadrasana_III__side": PoseAngleConfig(
+    "Warrior_III_Pose_or_Virabhadrasana_III__side": _pc(
         pose_name="Warrior_III_Pose_or_Virabhadrasana_III__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
          required_connections=[
-            ConnectionDefinition(
-                name="right hand holds left hand ",
-                point1="right_wrist",
-                point2="left_wrist",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
+            _hold("right hand holds left hand ", "right_wrist", "left_wrist"),
         ],
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=155.5,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=159.9,
                 tolerance=30.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=170.9,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=172.5,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="curve",
-                points=("left_shoulder", "right_hip", "right_knee"),  # TODO: Update with actual keypoint names
+                points=("left_shoulder", "right_hip", "right_knee"),
                 target_angle=104.1,
                 tolerance=30.0,
                 weight=3.0
@@ -4025,65 +3019,36 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Wide-Angle_Seated_Forward_Bend_pose_or_Upavistha_Konasana__ (Front View)
-    "Wide-Angle_Seated_Forward_Bend_pose_or_Upavistha_Konasana__front": PoseAngleConfig(
+    "Wide-Angle_Seated_Forward_Bend_pose_or_Upavistha_Konasana__front": _pc(
         pose_name="Wide-Angle_Seated_Forward_Bend_pose_or_Upavistha_Konasana__",
         view="front",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
-          required_connections=[
-            ConnectionDefinition(
-                name="right hand holds right leg",
-                point1="right_wrist",
-                point2="right_ankle",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
-            ConnectionDefinition(
-                name="left hand holds left leg",
-                point1="left_wrist",
-                point2="left_ankle",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
-        ],
+        required_keypoints=_FULL_BODY_KPS,
+          required_connections=_HANDS_HOLD_SAME_SIDE_LEGS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=175.5,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=171.2,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=176.2,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=179.7,
                 tolerance=30.0,
                 weight=4.0
@@ -4092,56 +3057,42 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Wide-Legged_Forward_Bend_pose_or_Prasarita_Padottanasana__ (Front View)
-    "Wide-Legged_Forward_Bend_pose_or_Prasarita_Padottanasana__front": PoseAngleConfig(
+    "Wide-Legged_Forward_Bend_pose_or_Prasarita_Padottanasana__front": _pc(
         pose_name="Wide-Legged_Forward_Bend_pose_or_Prasarita_Padottanasana__",
         view="front",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=90.7,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=82.4,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=171.7,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=176.6,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="curve",
-                points=("right_shoulder", "right_hip", "right_knee"),  
+                points=_RIGHT_SIDE_CURVE,  
                 target_angle=32.6,
                 tolerance=30.0,
                 weight=4.0
@@ -4150,56 +3101,42 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Wild_Thing_pose_or_Camatkarasana__ (Side View)
-    "Wild_Thing_pose_or_Camatkarasana__side": PoseAngleConfig(
+    "Wild_Thing_pose_or_Camatkarasana__side": _pc(
         pose_name="Wild_Thing_pose_or_Camatkarasana__",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
+        required_keypoints=_FULL_BODY_KPS,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=176.5,
                 tolerance=25.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=160.7,
                 tolerance=30.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=178.3,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=102.3,
                 tolerance=30.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="curve",
-                points=("left_shoulder", "left_hip", "left_knee"),  # TODO: Update with actual keypoint names
+                points=("left_shoulder", "left_hip", "left_knee"),
                 target_angle=130.6,
                 tolerance=30.0,
                 weight=4.0
@@ -4208,58 +3145,36 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
     ),
 
     # Wind_Relieving_pose_or_Pawanmuktasana_ (Side View)
-    "Wind_Relieving_pose_or_Pawanmuktasana_side": PoseAngleConfig(
+    "Wind_Relieving_pose_or_Pawanmuktasana_side": _pc(
         pose_name="Wind_Relieving_pose_or_Pawanmuktasana_",
         view="side",
-        required_keypoints=[
-            "nose",
-            "left_shoulder",
-            "right_shoulder",
-            "left_elbow",
-            "right_elbow",
-            "left_wrist",
-            "right_wrist",
-            "left_hip",
-            "right_hip",
-            "left_knee",
-            "right_knee",
-            "left_ankle",
-            "right_ankle"
-        ],
-         required_connections=[
-            ConnectionDefinition(
-                name="right hand holds left hand",
-                point1="right_wrist",
-                point2="left_wrist",
-                max_distance=0.35,  # 15% of normalized space
-                weight=2.0
-            ),
-        ],
+        required_keypoints=_FULL_BODY_KPS,
+         required_connections=_HANDS_CLASPED,
         required_angles=[
-            AngleDefinition(
+            _ad(
                 name="left hand",
-                points=('left_shoulder', 'left_elbow', 'left_wrist'),
+                points=_LEFT_ARM,
                 target_angle=73.4,
                 tolerance=30.0,
                 weight=3.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right hand",
-                points=('right_shoulder', 'right_elbow', 'right_wrist'),
+                points=_RIGHT_ARM,
                 target_angle=82.4,
                 tolerance=35.0,
                 weight=2.0
             ),
-            AngleDefinition(
+            _ad(
                 name="left leg",
-                points=('left_hip', 'left_knee', 'left_ankle'),
+                points=_LEFT_LEG,
                 target_angle=27.6,
                 tolerance=30.0,
                 weight=4.0
             ),
-            AngleDefinition(
+            _ad(
                 name="right leg",
-                points=('right_hip', 'right_knee', 'right_ankle'),
+                points=_RIGHT_LEG,
                 target_angle=178.2,
                 tolerance=30.0,
                 weight=4.0
@@ -4269,16 +3184,237 @@ POSE_ANGLE_DEFINITIONS: Dict[str, PoseAngleConfig] = {
 
 }
 
+# Only needed while the definitions above were being built
+_interned.clear()
+
+# Sorted once at import; configurations only change when this file is edited
+_CONFIGURED_POSE_IDS: Tuple[str, ...] = tuple(sorted(POSE_ANGLE_DEFINITIONS))
+
+def _unknown_keypoint_names(config: PoseAngleConfig) -> List[str]:
+    """Keypoint names used by a config that are not MediaPipe landmarks, labelled by where they occur"""
+    used = [("required_keypoints", name) for name in config.required_keypoints]
+    used += [(angle_def.name, point) for angle_def in config.required_angles for point in angle_def.points]
+    used += [
+        (conn_def.name, point)
+        for conn_def in config.required_connections or ()
+        for point in (conn_def.point1, conn_def.point2)
+    ]
+    return [f"{where}: {name}" for where, name in used if name not in LANDMARK_INDICES]
+
+
+# Every keypoint name (angle points, connection points and required
+# keypoints) must be a MediaPipe landmark. Checked once at import (typos and
+# leftover placeholder names alike) so scoring never has to deal with
+# unresolvable names. Raised rather than asserted so it also holds under -O
+_unknown_names = [
+    f"{pose_id} / {problem}"
+    for pose_id, config in POSE_ANGLE_DEFINITIONS.items()
+    for problem in _unknown_keypoint_names(config)
+]
+if _unknown_names:
+    raise PoseConfigError(
+        f"Pose definitions use {len(_unknown_names)} unknown keypoint name(s):\n  "
+        + "\n  ".join(_unknown_names)
+    )
+del _unknown_names
+
+# Pose ids end in their camera view (e.g. "..._front"); POSES_BY_VIEW buckets
+# by config.view, so a mismatch would list a pose under the wrong view
+_wrong_views = [
+    f"{pose_id} / view={config.view!r}"
+    for pose_id, config in POSE_ANGLE_DEFINITIONS.items()
+    if not pose_id.endswith(f"_{config.view}")
+]
+if _wrong_views:
+    raise PoseConfigError(
+        f"Pose definitions declare a view that does not match the pose id:\n  "
+        + "\n  ".join(_wrong_views)
+    )
+del _wrong_views
+
+
+# Column layout of the flat tables below. Every landmark column holds a valid
+# landmark index, as unknown names were rejected above.
+POSE_TABLE_COLUMNS = (
+    "pose_row", "angle_idx", "p1", "vertex", "p2", "target", "tolerance", "weight"
+)
+CONN_TABLE_COLUMNS = ("pose_row", "conn_idx", "p1", "p2", "max_distance", "weight", "max_distance_sq")
+ANGLE_COL: Dict[str, int] = {name: i for i, name in enumerate(POSE_TABLE_COLUMNS)}
+CONN_COL: Dict[str, int] = {name: i for i, name in enumerate(CONN_TABLE_COLUMNS)}
+
+
+def _build_tables() -> Tuple[np.ndarray, Dict[str, slice], np.ndarray, Dict[str, slice]]:
+    """
+    Flatten every pose's angles and connections into two read-only arrays
+    
+    Returns:
+        (POSE_TABLE, POSE_OFFSETS, CONN_TABLE, CONN_OFFSETS), where the
+        offsets map a pose id to its slice of rows in the table
+    """
+    angle_rows = []
+    conn_rows = []
+    pose_offsets = {}
+    conn_offsets = {}
+    
+    for pose_row, pose_id in enumerate(_CONFIGURED_POSE_IDS):
+        config = POSE_ANGLE_DEFINITIONS[pose_id]
+        
+        start = len(angle_rows)
+        for angle_idx, angle_def in enumerate(config.required_angles):
+            angle_rows.append((
+                pose_row, angle_idx, *angle_def.points_idx,
+                angle_def.target_angle, angle_def.tolerance, angle_def.weight
+            ))
+        pose_offsets[pose_id] = slice(start, len(angle_rows))
+        
+        start = len(conn_rows)
+        for conn_idx, conn_def in enumerate(config.required_connections or ()):
+            conn_rows.append((
+                pose_row, conn_idx,
+                conn_def.point1_idx, conn_def.point2_idx,
+                conn_def.max_distance, conn_def.weight, conn_def.max_distance_sq
+            ))
+        conn_offsets[pose_id] = slice(start, len(conn_rows))
+    
+    pose_table = np.array(angle_rows, dtype=PARAM_DTYPE).reshape(-1, len(POSE_TABLE_COLUMNS))
+    conn_table = np.array(conn_rows, dtype=PARAM_DTYPE).reshape(-1, len(CONN_TABLE_COLUMNS))
+    pose_table.setflags(write=False)
+    conn_table.setflags(write=False)
+    
+    return pose_table, pose_offsets, conn_table, conn_offsets
+
+
+POSE_TABLE, POSE_OFFSETS, CONN_TABLE, CONN_OFFSETS = _build_tables()
+
+# The per-angle scoring constants as dense 3-wide rows (24 bytes each), in
+# POSE_TABLE row order, so scoring reads one contiguous block per pose
+ANGLE_PARAM_COLUMNS = ("target", "tolerance", "weight")
+ANGLE_PARAM_COL: Dict[str, int] = {name: i for i, name in enumerate(ANGLE_PARAM_COLUMNS)}
+ANGLE_PARAMS = np.ascontiguousarray(POSE_TABLE[:, [ANGLE_COL[name] for name in ANGLE_PARAM_COLUMNS]])
+ANGLE_PARAMS.setflags(write=False)
+
+# Landmark indices of every POSE_TABLE row's (point1, vertex, point2), and the
+# position in list_configured_poses() of the pose each row belongs to, so one
+# frame can be scored against every pose in a single pass
+ANGLE_POINTS_IDX = POSE_TABLE[:, [ANGLE_COL["p1"], ANGLE_COL["vertex"], ANGLE_COL["p2"]]].astype(np.intp)
+ANGLE_POSE_ROWS = POSE_TABLE[:, ANGLE_COL["pose_row"]].astype(np.intp)
+ANGLE_POINTS_IDX.setflags(write=False)
+ANGLE_POSE_ROWS.setflags(write=False)
+
+# The same for connections: landmark indices of every CONN_TABLE row's
+# (point1, point2) and the position of its pose in list_configured_poses()
+CONN_POINTS_IDX = CONN_TABLE[:, [CONN_COL["p1"], CONN_COL["p2"]]].astype(np.intp)
+CONN_POSE_ROWS = CONN_TABLE[:, CONN_COL["pose_row"]].astype(np.intp)
+CONN_POINTS_IDX.setflags(write=False)
+CONN_POSE_ROWS.setflags(write=False)
+
+# Point each pose's packed target/tolerance/weight arrays at its rows of
+# ANGLE_PARAMS, so pose configs don't hold their own copies. This is the only
+# write to a (frozen) config after construction, and it happens here at
+# import, before the configs are published read-only below
+for _pose_id, _rows in POSE_OFFSETS.items():
+    _config = POSE_ANGLE_DEFINITIONS[_pose_id]
+    object.__setattr__(_config, "packed", _config.packed._replace(
+        targets=ANGLE_PARAMS[_rows, ANGLE_PARAM_COL["target"]],
+        tolerances=ANGLE_PARAMS[_rows, ANGLE_PARAM_COL["tolerance"]],
+        weights=ANGLE_PARAMS[_rows, ANGLE_PARAM_COL["weight"]]
+    ))
+del _pose_id, _rows, _config
+
+# Configurations are fixed at import: expose them read-only, and bucket the
+# sorted pose ids by camera view so filtering by view needs no scan
+POSE_ANGLE_DEFINITIONS: Mapping[str, PoseAngleConfig] = MappingProxyType(POSE_ANGLE_DEFINITIONS)
+POSES_BY_VIEW: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    view: tuple(pose_id for pose_id in _CONFIGURED_POSE_IDS if POSE_ANGLE_DEFINITIONS[pose_id].view == view)
+    for view in sorted({config.view for config in POSE_ANGLE_DEFINITIONS.values()})
+})
+
+class AngleRows(NamedTuple):
+    """Parallel slices of the all-pose angle arrays, for scoring many poses at once"""
+    points_idx: np.ndarray  # (N, 3) rows of ANGLE_POINTS_IDX
+    params: np.ndarray  # (N, 3) rows of ANGLE_PARAMS
+    pose_rows: np.ndarray  # (N,) rows of ANGLE_POSE_ROWS
+
+
+def _angle_rows(rows: np.ndarray) -> AngleRows:
+    """Read-only copies of the given rows of the all-pose angle arrays"""
+    angle_rows = AngleRows(ANGLE_POINTS_IDX[rows], ANGLE_PARAMS[rows], ANGLE_POSE_ROWS[rows])
+    for array in angle_rows:
+        array.setflags(write=False)
+    return angle_rows
+
+
+# The angle rows of the poses configured for each view, copied out once so
+# scoring every pose of one view only measures that view's angles
+ANGLE_ROWS_BY_VIEW: Mapping[str, AngleRows] = MappingProxyType({
+    view: _angle_rows(np.concatenate([
+        np.arange(POSE_TABLE.shape[0])[POSE_OFFSETS[pose_id]] for pose_id in pose_ids
+    ]))
+    for view, pose_ids in POSES_BY_VIEW.items()
+})
+
+# Sorted pose ids grouped by required keypoint mask. Most poses share the
+# full-body set, so "are the required keypoints there?" is one check per group
+POSES_BY_KEYPOINT_MASK: Mapping[int, Tuple[str, ...]] = MappingProxyType({
+    mask: tuple(pose_id for pose_id in _CONFIGURED_POSE_IDS if POSE_ANGLE_DEFINITIONS[pose_id].keypoint_mask == mask)
+    for mask in sorted({config.keypoint_mask for config in POSE_ANGLE_DEFINITIONS.values()})
+})
+
 
 def get_pose_config(pose_id: str) -> PoseAngleConfig:
+    """
+    Get the angle configuration for a pose
     
+    Configurations are immutable and built once at import, so this is a
+    plain lookup returning the shared object; there is nothing to cache
     
+    Raises:
+        KeyError: If the pose has no configuration
+    """
     return POSE_ANGLE_DEFINITIONS[pose_id]
 
 
-def list_configured_poses() -> List[str]:
-    """List all poses that have angle configurations"""
-    return sorted(list(POSE_ANGLE_DEFINITIONS.keys()))
+def angle_params_for(pose_id: str) -> np.ndarray:
+    """
+    A pose's (A, 3) rows of ANGLE_PARAMS (a read-only view, lanes in ANGLE_PARAM_COLUMNS)
+    
+    Raises:
+        KeyError: If the pose has no configuration
+    """
+    return ANGLE_PARAMS[POSE_OFFSETS[pose_id]]
+
+
+def list_configured_poses(view: Optional[str] = None) -> Tuple[str, ...]:
+    """
+    List all poses that have angle configurations
+    
+    Args:
+        view: Only list poses configured for this camera view ('front' or 'side')
+        
+    Returns:
+        Sorted pose ids, as a shared immutable tuple (not copied per call)
+    """
+    if view is None:
+        return _CONFIGURED_POSE_IDS
+    return POSES_BY_VIEW.get(view, ())
+
+
+def list_poses_with_keypoints(detected_mask: int) -> List[str]:
+    """
+    List the configured poses whose required keypoints were all detected
+    
+    Args:
+        detected_mask: Bitmask of detected landmarks (bit i for landmark i)
+        
+    Returns:
+        Sorted pose ids that can be scored with these keypoints
+    """
+    return sorted(
+        pose_id
+        for mask, pose_ids in POSES_BY_KEYPOINT_MASK.items()
+        if detected_mask & mask == mask
+        for pose_id in pose_ids
+    )
 
 
 def has_config(pose_id: str) -> bool:
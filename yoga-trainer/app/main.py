@@ -1,12 +1,48 @@
+import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import HTMLResponse
 from pathlib import Path
+from typing import Optional, Tuple
 
 from app.config import settings
 from app.models.schemas import HealthCheckResponse
 from app.api.routes import pose_detection, accuracy, reference, manual_accuracy
+from app.config.pose_angles import list_configured_poses
+from app.services.accuracy_calculator import get_accuracy_calculator
+from app.services.manual_accuracy_calculator import get_manual_accuracy_calculator
+from app.services.pose_detector import get_pose_detector
+from app.services.reference_cache import load_reference
+from app.services.reference_index import load_index
+
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize the application on startup and clean up on shutdown"""
+    print(f"Starting {settings.app_name} v{settings.app_version}")
+    
+    # Create necessary directories
+    settings.reference_poses_dir.mkdir(parents=True, exist_ok=True)
+    settings.reference_images_dir.mkdir(parents=True, exist_ok=True)
+    settings.reference_keypoints_dir.mkdir(parents=True, exist_ok=True)
+    settings.uploads_dir.mkdir(parents=True, exist_ok=True)
+    
+    try:
+        warm_up()
+    except Exception:
+        logger.exception("Warm-up failed")
+    
+    print(f"API available at: http://localhost:8000")
+    print(f"API Docs: http://localhost:8000/docs")
+    
+    yield
+    
+    print(f"Shutting down {settings.app_name}")
 
 
 # Create FastAPI app
@@ -14,7 +50,8 @@ app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     description="Yoga Pose Accuracy Measurement API - Compare user poses with reference yoga poses",
-    debug=settings.debug
+    debug=settings.debug,
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -38,14 +75,26 @@ if frontend_dir.exists():
     app.mount("/static", StaticFiles(directory=str(frontend_dir)), name="static")
 
 
+# (mtime_ns, content) of the last frontend index.html read from disk
+_index_html_cache: Optional[Tuple[int, str]] = None
+
+
 @app.get("/", response_class=HTMLResponse)
 async def root():
-    """Serve frontend HTML"""
+    """Serve frontend HTML, re-reading index.html only when it changes"""
+    global _index_html_cache
+    
     frontend_file = frontend_dir / "index.html"
     
-    if frontend_file.exists():
-        with open(frontend_file, 'r') as f:
-            return f.read()
+    try:
+        mtime_ns = frontend_file.stat().st_mtime_ns
+    except FileNotFoundError:
+        mtime_ns = None
+    
+    if mtime_ns is not None:
+        if _index_html_cache is None or _index_html_cache[0] != mtime_ns:
+            _index_html_cache = (mtime_ns, frontend_file.read_text())
+        return _index_html_cache[1]
     
     return """
     <html>
@@ -72,25 +121,37 @@ async def health_check():
     )
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize application on startup"""
-    print(f"Starting {settings.app_name} v{settings.app_version}")
+def warm_up():
+    """
+    Run one calculation through each accuracy path so the first user
+    request doesn't pay for lazy imports, NumPy setup, model loading and
+    cold caches
+    """
+    load_index()
     
-    # Create necessary directories
-    settings.reference_poses_dir.mkdir(parents=True, exist_ok=True)
-    settings.reference_images_dir.mkdir(parents=True, exist_ok=True)
-    settings.reference_keypoints_dir.mkdir(parents=True, exist_ok=True)
-    settings.uploads_dir.mkdir(parents=True, exist_ok=True)
+    for pose_id in list_configured_poses():
+        try:
+            reference = load_reference(pose_id)
+        except (FileNotFoundError, ValueError):
+            continue
+        
+        get_manual_accuracy_calculator().calculate_accuracy(
+            user_keypoints=reference.keypoints,
+            pose_id=pose_id,
+            reference_keypoints=reference.keypoints
+        )
+        get_manual_accuracy_calculator().rank_poses(reference.keypoints, limit=1)
+        get_accuracy_calculator().calculate_accuracy_arrays(
+            ref_xyz=reference.xyz,
+            user_xyz=reference.xyz,
+            ref_vis=reference.visibility,
+            user_vis=reference.visibility
+        )
+        logger.info("Warmed up accuracy calculators with %s", pose_id)
+        break
     
-    print(f"API available at: http://localhost:8000")
-    print(f"API Docs: http://localhost:8000/docs")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on shutdown"""
-    print(f"Shutting down {settings.app_name}")
+    # Load the MediaPipe model now rather than on the first detection
+    get_pose_detector()
 
 
 if __name__ == "__main__":
@@ -15,6 +15,23 @@ class CalculateAccuracyRequest(BaseModel):
     reference_pose_id: str = Field(..., description="ID of reference pose to compare against")
 
 
+class CalculateAccuracyFlatRequest(BaseModel):
+    """Request to calculate pose accuracy from a flat keypoint array"""
+    user_keypoints: List[float] = Field(
+        ...,
+        min_length=132,
+        max_length=132,
+        description="User's 33 keypoints flattened as x, y, z, visibility in landmark order"
+    )
+    reference_pose_id: str = Field(..., description="ID of reference pose to compare against")
+
+
+class CalculateAccuracyBatchRequest(BaseModel):
+    """Request to calculate pose accuracy for several frames"""
+    reference_pose_id: str = Field(..., description="ID of reference pose to compare against")
+    frames: List[List[Keypoint]] = Field(..., min_length=1, description="User keypoints for each frame")
+
+
 class UploadReferencePoseRequest(BaseModel):
     """Request to upload custom reference pose"""
     pose_id: str = Field(..., description="Unique pose identifier")
@@ -41,6 +58,14 @@ class CalculateAccuracyResponse(BaseModel):
     error: Optional[str] = None
 
 
+class CalculateAccuracyBatchResponse(BaseModel):
+    """Response from batch accuracy calculation"""
+    success: bool
+    message: str
+    results: List[CalculateAccuracyResponse] = []
+    error: Optional[str] = None
+
+
 class ReferencePoseSummary(BaseModel):
     """Summary of reference pose for listing"""
     pose_id: str
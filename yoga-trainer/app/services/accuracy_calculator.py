@@ -1,11 +1,38 @@
 import numpy as np
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 from app.models.pose import Keypoint, JointAngles, JointFeedback, AccuracyResult
-from app.utils.geometry import calculate_angle, euclidean_distance
-from app.utils.keypoint_utils import normalize_keypoints, get_keypoint_by_name
+from app.utils.geometry import calculate_angle, calculate_angles, euclidean_distance
+from app.utils.keypoint_utils import (
+    LANDMARK_INDICES,
+    normalize_keypoints,
+    normalize_keypoint_array,
+    get_keypoint_by_name,
+    keypoints_to_array,
+)
 from app.config import settings
 
 
+# Joints scored by calculate_joint_angles: (joint name, (point1, vertex, point2))
+JOINT_DEFINITIONS = [
+    ("left_elbow", ("left_shoulder", "left_elbow", "left_wrist")),
+    ("right_elbow", ("right_shoulder", "right_elbow", "right_wrist")),
+    ("left_shoulder", ("left_elbow", "left_shoulder", "left_hip")),
+    ("right_shoulder", ("right_elbow", "right_shoulder", "right_hip")),
+    ("left_hip", ("left_shoulder", "left_hip", "left_knee")),
+    ("right_hip", ("right_shoulder", "right_hip", "right_knee")),
+    ("left_knee", ("left_hip", "left_knee", "left_ankle")),
+    ("right_knee", ("right_hip", "right_knee", "right_ankle")),
+]
+
+JOINT_NAMES = [name for name, _ in JOINT_DEFINITIONS]
+
+# (J, 3) landmark indices of each joint's (point1, vertex, point2)
+JOINT_INDICES = np.array(
+    [[LANDMARK_INDICES[p] for p in points] for _, points in JOINT_DEFINITIONS],
+    dtype=np.intp
+)
+
+
 class AccuracyCalculator:
     """Calculate pose accuracy by comparing user pose with reference pose"""
     
@@ -201,6 +228,200 @@ class AccuracyCalculator:
         
         return min(100.0, max(0.0, score))
     
+    def calculate_joint_angles_array(self, xyz: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Array version of calculate_joint_angles
+        
+        Args:
+            xyz: (N, 3) keypoint coordinates in landmark order, or a
+                (B, N, 3) stack of poses
+            
+        Returns:
+            Angles for JOINT_NAMES in order (shape (J,) or (B, J)), or None
+            if keypoints are missing
+        """
+        if xyz.shape[-2] <= JOINT_INDICES.max():
+            return None
+        
+        return calculate_angles(
+            xyz[..., JOINT_INDICES[:, 0], :],
+            xyz[..., JOINT_INDICES[:, 1], :],
+            xyz[..., JOINT_INDICES[:, 2], :]
+        )
+    
+    def calculate_angle_similarity_array(
+        self,
+        ref_angles: Optional[np.ndarray],
+        user_angles: Optional[np.ndarray]
+    ) -> Tuple[float, List[JointFeedback]]:
+        """
+        Array version of calculate_angle_similarity
+        
+        Args:
+            ref_angles: Reference joint angles (JOINT_NAMES order) or None
+            user_angles: User joint angles (JOINT_NAMES order) or None
+            
+        Returns:
+            (score, feedback) tuple
+        """
+        if ref_angles is None or user_angles is None:
+            return 0.0, []
+        
+        angle_diffs = np.abs(ref_angles - user_angles)
+        scores = np.maximum(0, 100 - angle_diffs * self.angle_penalty)
+        
+        feedback_list = []
+        for joint_name, score, angle_diff in zip(JOINT_NAMES, scores.tolist(), angle_diffs.tolist()):
+            if score >= 90:
+                message = "Excellent!"
+            elif score >= 75:
+                message = f"Good, adjust by {angle_diff:.1f}°"
+            elif score >= 50:
+                message = f"Needs adjustment: {angle_diff:.1f}° off"
+            else:
+                message = f"Incorrect angle: {angle_diff:.1f}° difference"
+            
+            feedback_list.append(JointFeedback(
+                joint_name=joint_name.replace("_", " ").title(),
+                score=round(score, 2),
+                angle_difference=round(angle_diff, 2),
+                feedback_message=message
+            ))
+        
+        return float(scores.mean()), feedback_list
+    
+    def calculate_distance_similarity_array(
+        self,
+        ref_xyz: np.ndarray,
+        user_xyz: np.ndarray,
+        ref_vis: np.ndarray,
+        user_vis: np.ndarray
+    ) -> float:
+        """
+        Array version of calculate_distance_similarity
+        
+        Args:
+            ref_xyz: Normalized (N, 3) reference coordinates
+            user_xyz: Normalized (N, 3) user coordinates
+            ref_vis: (N,) reference visibilities
+            user_vis: (N,) user visibilities
+            
+        Returns:
+            Distance similarity score (0-100)
+        """
+        if len(ref_xyz) != len(user_xyz):
+            return 0.0
+        
+        # Only compare visible keypoints
+        visible = (ref_vis > 0.5) & (user_vis > 0.5)
+        if not visible.any():
+            return 0.0
+        
+        distances = np.linalg.norm(ref_xyz[visible, :2] - user_xyz[visible, :2], axis=1)
+        avg_distance = distances.mean()
+        
+        score = 100 * np.exp(-avg_distance * 10)
+        
+        return float(min(100.0, max(0.0, score)))
+    
+    def calculate_accuracy_arrays(
+        self,
+        ref_xyz: np.ndarray,
+        user_xyz: np.ndarray,
+        ref_vis: np.ndarray,
+        user_vis: np.ndarray
+    ) -> AccuracyResult:
+        """
+        Calculate overall pose accuracy from keypoint arrays
+        
+        Args:
+            ref_xyz: (N, 3) reference coordinates in landmark order
+            user_xyz: (N, 3) user coordinates in landmark order
+            ref_vis: (N,) reference visibilities
+            user_vis: (N,) user visibilities
+            
+        Returns:
+            AccuracyResult with scores and feedback
+        """
+        # Normalize both poses
+        ref_normalized = normalize_keypoint_array(ref_xyz)
+        user_normalized = normalize_keypoint_array(user_xyz)
+        
+        # Calculate angle similarity
+        angle_score, joint_feedback = self.calculate_angle_similarity_array(
+            self.calculate_joint_angles_array(ref_normalized),
+            self.calculate_joint_angles_array(user_normalized)
+        )
+        
+        # Calculate distance similarity
+        distance_score = self.calculate_distance_similarity_array(
+            ref_normalized, user_normalized, ref_vis, user_vis
+        )
+        
+        return self._build_result(angle_score, joint_feedback, distance_score)
+    
+    def calculate_accuracy_batch(
+        self,
+        ref_xyz: np.ndarray,
+        ref_vis: np.ndarray,
+        user_arrays: List[np.ndarray]
+    ) -> List[AccuracyResult]:
+        """
+        Calculate accuracy of several user frames against one reference pose
+        
+        Frames with as many keypoints as the reference are stacked and
+        scored together; any others fall back to calculate_accuracy_arrays.
+        
+        Args:
+            ref_xyz: (N, 3) reference coordinates in landmark order
+            ref_vis: (N,) reference visibilities
+            user_arrays: Per-frame (N, 4) arrays of x, y, z, visibility
+            
+        Returns:
+            AccuracyResult for each frame, in order
+        """
+        results: List[Optional[AccuracyResult]] = [None] * len(user_arrays)
+        
+        stacked = [i for i, frame in enumerate(user_arrays) if len(frame) == len(ref_xyz)]
+        for i, frame in enumerate(user_arrays):
+            if len(frame) != len(ref_xyz):
+                results[i] = self.calculate_accuracy_arrays(
+                    ref_xyz, frame[:, :3], ref_vis, frame[:, 3]
+                )
+        
+        if stacked:
+            frames = np.stack([user_arrays[i] for i in stacked])  # (B, N, 4)
+            user_vis = frames[:, :, 3]
+            
+            ref_normalized = normalize_keypoint_array(ref_xyz)
+            user_normalized = normalize_keypoint_array(frames[:, :, :3])
+            
+            ref_angles = self.calculate_joint_angles_array(ref_normalized)
+            user_angles = self.calculate_joint_angles_array(user_normalized)
+            
+            # Mean 2D distance over keypoints visible in both poses, per frame
+            visible = (ref_vis > 0.5) & (user_vis > 0.5)  # (B, N)
+            diff = user_normalized[:, :, :2] - ref_normalized[:, :2]
+            distances = np.sqrt(np.einsum('bnd,bnd->bn', diff, diff))
+            valid_counts = visible.sum(axis=1)
+            avg_distances = (distances * visible).sum(axis=1) / np.maximum(valid_counts, 1)
+            distance_scores = np.where(
+                valid_counts > 0,
+                np.clip(100 * np.exp(-avg_distances * 10), 0.0, 100.0),
+                0.0
+            )
+            
+            for b, i in enumerate(stacked):
+                angle_score, joint_feedback = self.calculate_angle_similarity_array(
+                    ref_angles,
+                    user_angles[b] if user_angles is not None else None
+                )
+                results[i] = self._build_result(
+                    angle_score, joint_feedback, float(distance_scores[b])
+                )
+        
+        return results
+    
     def calculate_accuracy(
         self, 
         reference_keypoints: List[Keypoint], 
@@ -216,20 +437,23 @@ class AccuracyCalculator:
         Returns:
             AccuracyResult with scores and feedback
         """
-        # Normalize both poses
-        ref_normalized = normalize_keypoints(reference_keypoints)
-        user_normalized = normalize_keypoints(user_keypoints)
-        
-        # Calculate joint angles
-        ref_angles = self.calculate_joint_angles(ref_normalized)
-        user_angles = self.calculate_joint_angles(user_normalized)
-        
-        # Calculate angle similarity
-        angle_score, joint_feedback = self.calculate_angle_similarity(ref_angles, user_angles)
-        
-        # Calculate distance similarity
-        distance_score = self.calculate_distance_similarity(ref_normalized, user_normalized)
+        ref_array = keypoints_to_array(reference_keypoints)
+        user_array = keypoints_to_array(user_keypoints)
         
+        return self.calculate_accuracy_arrays(
+            ref_xyz=ref_array[:, :3],
+            user_xyz=user_array[:, :3],
+            ref_vis=ref_array[:, 3],
+            user_vis=user_array[:, 3]
+        )
+    
+    def _build_result(
+        self,
+        angle_score: float,
+        joint_feedback: List[JointFeedback],
+        distance_score: float
+    ) -> AccuracyResult:
+        """Combine angle and distance scores into an AccuracyResult"""
         # Calculate weighted overall score
         overall_accuracy = (
             self.angle_weight * angle_score + 
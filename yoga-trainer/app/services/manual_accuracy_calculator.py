@@ -2,11 +2,34 @@
 Manual accuracy calculator using predefined angles per pose
 """
 
-from typing import List, Dict, Optional
+import logging
+from typing import List, Dict, Optional, Tuple
 import math
+import numpy as np
 from app.models.pose import Keypoint
-from app.config.pose_angles import get_pose_config, AngleDefinition, has_config
-from app.utils.geometry import calculate_angle as calc_angle_util
+from app.config.pose_angles import (
+    get_pose_config,
+    AngleDefinition,
+    ConnectionDefinition,
+    has_config,
+    angle_params_for,
+    list_configured_poses,
+    list_poses_with_keypoints,
+    ANGLE_PARAM_COL,
+    ANGLE_PARAMS,
+    ANGLE_POINTS_IDX,
+    ANGLE_POSE_ROWS,
+    ANGLE_ROWS_BY_VIEW,
+    CONN_COL,
+    CONN_TABLE,
+    CONN_POINTS_IDX,
+    CONN_POSE_ROWS
+)
+from app.utils.geometry import calculate_angles
+from app.utils.keypoint_utils import LANDMARK_INDICES, MIRRORED_LANDMARKS, keypoints_to_array
+
+
+logger = logging.getLogger(__name__)
 
 
 class ManualAccuracyCalculator:
@@ -42,18 +65,43 @@ class ManualAccuracyCalculator:
         # Get the angle configuration for this pose
         pose_config = get_pose_config(pose_id)
         
-        # Convert keypoints list to dictionary for easy lookup
-        keypoint_dict = {kp.name: kp for kp in user_keypoints if kp.name}
+        # Convert the keypoint models to an (N, 4) array once; everything
+        # below works on it. Rows are looked up by name (the last keypoint
+        # with a given name wins)
+        user_array = keypoints_to_array(user_keypoints)
+        user_rows = {kp.name: i for i, kp in enumerate(user_keypoints) if kp.name}
+        
+        # User (x, y) and visibility in landmark order; NaN where a landmark
+        # wasn't sent. Also collect which landmarks were sent and which are
+        # barely visible as bitmasks, to test against the pose's required
+        # keypoint mask
+        landmark_idx = []
+        array_rows = []
+        for name, row in user_rows.items():
+            idx = LANDMARK_INDICES.get(name)
+            if idx is not None:
+                landmark_idx.append(idx)
+                array_rows.append(row)
+        
+        user_xy = np.full((len(LANDMARK_INDICES), 2), np.nan)
+        user_visibility = np.full(len(LANDMARK_INDICES), np.nan)
+        user_xy[landmark_idx] = user_array[array_rows, :2]
+        user_visibility[landmark_idx] = user_array[array_rows, 3]
+        
+        present_mask = 0
+        low_visibility_mask = 0
+        for idx, visibility in zip(landmark_idx, user_array[array_rows, 3].tolist()):
+            present_mask |= 1 << idx
+            if visibility < 0.5:
+                low_visibility_mask |= 1 << idx
         
         # Validate that all required keypoints are present and visible
         missing_keypoints = []
-        low_visibility_keypoints = []
-        
-        for required_kp in pose_config.required_keypoints:
-            if required_kp not in keypoint_dict:
-                missing_keypoints.append(required_kp)
-            elif keypoint_dict[required_kp].visibility < 0.5:
-                low_visibility_keypoints.append(required_kp)
+        if not pose_config.has_all_keypoints(present_mask):
+            missing_mask = pose_config.keypoint_mask & ~present_mask
+            missing_keypoints = self._keypoints_in_mask(pose_config.required_keypoints, missing_mask)
+        low_visibility_mask &= pose_config.keypoint_mask
+        low_visibility_keypoints = self._keypoints_in_mask(pose_config.required_keypoints, low_visibility_mask)
         
         if missing_keypoints:
             return {
@@ -64,40 +112,64 @@ class ManualAccuracyCalculator:
                 "using_manual_angles": True
             }
         
-        # Calculate accuracy for each defined angle
+        # Calculate accuracy for all defined angles at once
         angle_scores = []
         total_weighted_score = 0.0
-        total_weight = 0.0
         
-        for angle_def in pose_config.required_angles:
-            try:
-                score_info = self._calculate_angle_score(
-                    keypoint_dict,
-                    angle_def
-                )
-                angle_scores.append(score_info)
-                
-                # Weighted scoring
-                total_weighted_score += score_info["score"] * angle_def.weight
-                total_weight += angle_def.weight
-            except Exception as e:
-                print(f"Error calculating angle {angle_def.name}: {e}")
+        packed = pose_config.packed
+        
+        # One gather for every angle's (point1, vertex, point2): (A, 3, 2)
+        angle_points = user_xy[packed.points_idx]
+        actual_angles = calculate_angles(
+            angle_points[:, 0],
+            angle_points[:, 1],
+            angle_points[:, 2]
+        )
+        deviations, scores = self._score_angles(pose_id, actual_angles)
+        valid = ~np.isnan(actual_angles)
+        
+        for i, angle_def in enumerate(pose_config.required_angles):
+            if not valid[i]:
+                logger.debug("Skipping angle %s: keypoints not found", angle_def.name)
                 # Skip this angle if calculation fails
                 continue
+            
+            score_info = self._build_angle_score(
+                angle_def,
+                actual_angles[i],
+                deviations[i],
+                scores[i]
+            )
+            angle_scores.append(score_info)
+            
+            # Weighted scoring
+            total_weighted_score += score_info["score"] * angle_def.weight
+        
+        # Normalize by the precomputed weight total unless angles were skipped
+        if valid.all():
+            total_weight = pose_config.angle_weight_total
+        else:
+            total_weight = sum(
+                angle_def.weight
+                for angle_def, angle_valid in zip(pose_config.required_angles, valid)
+                if angle_valid
+            )
         
         # Calculate connection scores (body part relationships)
         connection_scores = []
         connection_accuracy = 0.0
         
         if pose_config.required_connections:
-            print(f"DEBUG: Processing {len(pose_config.required_connections)} connection definitions")
+            logger.debug("Processing %d connection definitions", len(pose_config.required_connections))
             connection_result = self._calculate_connections(
-                keypoint_dict,
+                user_xy,
+                user_visibility,
+                present_mask,
                 pose_config.required_connections
             )
             connection_scores = connection_result["connection_scores"]
             connection_accuracy = connection_result["overall_connection_score"]
-            print(f"DEBUG: Connection result - {len(connection_scores)} scores, accuracy: {connection_accuracy}")
+            logger.debug("Connection result - %d scores, accuracy: %s", len(connection_scores), connection_accuracy)
         
         # Calculate overall accuracy
         angle_accuracy = (total_weighted_score / total_weight) if total_weight > 0 else 0.0
@@ -108,7 +180,8 @@ class ManualAccuracyCalculator:
         
         if reference_keypoints:
             position_result = self._calculate_position_matching(
-                user_keypoints,
+                user_array,
+                user_rows,
                 reference_keypoints,
                 pose_config.required_keypoints
             )
@@ -145,11 +218,6 @@ class ManualAccuracyCalculator:
         # Generate general feedback based on overall score
         general_feedback = self._generate_general_feedback(overall_accuracy, angle_scores)
         
-        # Collect all unique keypoint names used in angles
-        used_keypoints = set()
-        for angle_def in pose_config.required_angles:
-            used_keypoints.update(angle_def.points)
-        
         return {
             "overall_accuracy": round(overall_accuracy, 2),
             "angle_accuracy": round(angle_accuracy, 2),
@@ -165,40 +233,240 @@ class ManualAccuracyCalculator:
             "using_manual_angles": True,
             "using_position_matching": reference_keypoints is not None,
             "using_connections": pose_config.required_connections is not None,
-            "used_keypoints": list(used_keypoints),
+            "used_keypoints": list(pose_config.angle_keypoints),
             "low_visibility_warning": low_visibility_keypoints if low_visibility_keypoints else None
         }
     
-    def _calculate_angle_score(
+    def _score_angles(self, pose_id: str, measured_angles: np.ndarray):
+        """
+        Score measured angles against a pose's targets
+        
+        Args:
+            pose_id: Configured pose identifier
+            measured_angles: (..., A) angles in the pose's required_angles
+                order; leading dimensions (e.g. frames) are broadcast
+            
+        Returns:
+            (deviations, scores) arrays with the shape of measured_angles
+        """
+        return self._score_against(angle_params_for(pose_id), measured_angles)
+    
+    def _score_against(self, params: np.ndarray, measured_angles: np.ndarray):
+        """
+        Score measured angles against rows of ANGLE_PARAMS
+        
+        Args:
+            params: (A, 3) rows of ANGLE_PARAMS
+            measured_angles: (..., A) angles matching those rows
+            
+        Returns:
+            (deviations, scores) arrays with the shape of measured_angles
+        """
+        targets = params[:, ANGLE_PARAM_COL["target"]]
+        tolerances = params[:, ANGLE_PARAM_COL["tolerance"]]
+        
+        deviations = np.abs(measured_angles - targets)
+        
+        # Score decreases from 100 to 0 as deviation increases:
+        # 85-100% within tolerance, then 85-0% over the next tolerance range
+        scores = np.where(
+            deviations <= tolerances,
+            100 - (deviations / tolerances) * 15,
+            np.maximum(0, 85 - ((deviations - tolerances) / tolerances) * 85)
+        )
+        return deviations, scores
+    
+    def rank_poses(
         self,
-        keypoint_dict: Dict[str, Keypoint],
-        angle_def: AngleDefinition
-    ) -> Dict:
-        """Calculate score for a single angle"""
+        user_keypoints: List[Keypoint],
+        view: Optional[str] = None,
+        limit: Optional[int] = None,
+        include_mirrored: bool = False
+    ) -> List[Dict]:
+        """
+        Rank configured poses by how well one frame matches their angles,
+        e.g. to suggest which pose the user is attempting. Every pose's
+        angles are measured and scored in one pass over POSE_TABLE
         
-        # Get the three points that define this angle
-        point1_name, vertex_name, point2_name = angle_def.points
+        Unlike calculate_accuracy, per-angle scores are not rounded before
+        weighting, so accuracies can differ from its angle_accuracy by < 0.01
         
-        point1 = keypoint_dict[point1_name]
-        vertex = keypoint_dict[vertex_name]
-        point2 = keypoint_dict[point2_name]
+        Args:
+            user_keypoints: Detected keypoints from user's camera
+            view: Only rank poses configured for this camera view
+            limit: Return at most this many poses
+            include_mirrored: Also score the frame with left and right
+                swapped, so a pose done on the other side than it was
+                configured for still matches; each pose keeps its better score
+            
+        Returns:
+            List of {"pose_id", "angle_accuracy", "connection_accuracy",
+            "mirrored"} dicts, best match first (connection_accuracy is None
+            for poses without connections); poses whose required keypoints
+            are missing are left out
+        """
+        user_xy = np.full((len(LANDMARK_INDICES), 2), np.nan)
+        user_visibility = np.full(len(LANDMARK_INDICES), np.nan)
+        present_mask = 0
+        mirrored_mask = 0
+        for kp in user_keypoints:
+            landmark_idx = LANDMARK_INDICES.get(kp.name)
+            if landmark_idx is not None:
+                user_xy[landmark_idx] = (kp.x, kp.y)
+                user_visibility[landmark_idx] = kp.visibility
+                present_mask |= 1 << landmark_idx
+                mirrored_mask |= 1 << int(MIRRORED_LANDMARKS[landmark_idx])
+        
+        # Candidates from the frame as seen and, optionally, relabelled
+        # left-for-right
+        frames = [(user_xy, user_visibility, present_mask, False)]
+        if include_mirrored:
+            frames.append((
+                user_xy[MIRRORED_LANDMARKS],
+                user_visibility[MIRRORED_LANDMARKS],
+                mirrored_mask,
+                True
+            ))
         
-        # Calculate the actual angle using the utility function
-        actual_angle = calc_angle_util(point1, vertex, point2)
+        has_connections = np.bincount(CONN_POSE_ROWS, minlength=len(list_configured_poses())) > 0
+        allowed = set(list_configured_poses(view))
+        # pose_id -> (angle accuracy, connection accuracy, mirrored)
+        best: Dict[str, Tuple[float, Optional[float], bool]] = {}
+        for frame_xy, frame_visibility, frame_mask, mirrored in frames:
+            accuracies = self._all_pose_accuracies(frame_xy, view)
+            connection_accuracies = self._all_pose_connection_accuracies(frame_xy, frame_visibility)
+            candidates = allowed.intersection(list_poses_with_keypoints(frame_mask))
+            for pose_id, accuracy, connection_accuracy, pose_has_connections in zip(
+                list_configured_poses(),
+                accuracies.tolist(),
+                connection_accuracies.tolist(),
+                has_connections.tolist()
+            ):
+                if pose_id in candidates and (pose_id not in best or accuracy > best[pose_id][0]):
+                    best[pose_id] = (
+                        accuracy,
+                        connection_accuracy if pose_has_connections else None,
+                        mirrored
+                    )
+        
+        ranked = sorted(best.items(), key=lambda item: item[1][0], reverse=True)
+        if limit is not None:
+            ranked = ranked[:limit]
+        
+        return [
+            {
+                "pose_id": pose_id,
+                "angle_accuracy": round(accuracy, 2),
+                "connection_accuracy": round(connection_accuracy, 2) if connection_accuracy is not None else None,
+                "mirrored": mirrored
+            }
+            for pose_id, (accuracy, connection_accuracy, mirrored) in ranked
+        ]
+    
+    def _all_pose_connection_accuracies(self, user_xy: np.ndarray, user_visibility: np.ndarray) -> np.ndarray:
+        """
+        Weighted connection score of one frame against every configured pose,
+        scored like _calculate_connections (0 at max_distance, 100 when the
+        points touch) but for all poses' connections in one pass
         
-        # Calculate deviation from target
-        deviation = abs(actual_angle - angle_def.target_angle)
+        Args:
+            user_xy: (33, 2) user coordinates in landmark order, NaN where
+                a landmark is missing
+            user_visibility: (33,) user visibilities in landmark order
+            
+        Returns:
+            (P,) connection accuracies (0-100) in list_configured_poses()
+            order; connections whose points are missing or barely visible
+            are left out, as are poses without connections (score 0)
+        """
+        visibility = user_visibility[CONN_POINTS_IDX]  # (M, 2)
+        valid = (visibility >= 0.1).all(axis=1)
+        
+        deltas = user_xy[CONN_POINTS_IDX[:, 0]] - user_xy[CONN_POINTS_IDX[:, 1]]
+        distances_sq = np.einsum("...i,...i->...", deltas, deltas)
+        in_reach = valid & (distances_sq < CONN_TABLE[:, CONN_COL["max_distance_sq"]])
+        
+        # Only connections within reach need the square root
+        scores = np.zeros(len(CONN_TABLE))
+        max_distance = CONN_TABLE[in_reach, CONN_COL["max_distance"]]
+        scores[in_reach] = 100 * (1 - np.sqrt(distances_sq[in_reach]) / max_distance)
+        
+        weights = np.where(valid, CONN_TABLE[:, CONN_COL["weight"]], 0.0)
+        pose_count = len(list_configured_poses())
+        total_weight = np.bincount(CONN_POSE_ROWS, weights=weights, minlength=pose_count)
+        weighted_sum = np.bincount(CONN_POSE_ROWS, weights=scores * weights, minlength=pose_count)
+        
+        return np.divide(
+            weighted_sum,
+            total_weight,
+            out=np.zeros(pose_count),
+            where=total_weight > 0
+        )
+    
+    def _all_pose_accuracies(self, user_xy: np.ndarray, view: Optional[str] = None) -> np.ndarray:
+        """
+        Weighted angle accuracy of one frame against every configured pose
         
-        # Calculate score based on tolerance
-        # Score decreases from 100 to 0 as deviation increases
-        if deviation <= angle_def.tolerance:
-            # Within tolerance: 85-100% score (linear decrease)
-            score = 100 - (deviation / angle_def.tolerance) * 15
+        Args:
+            user_xy: (33, 2) user coordinates in landmark order, NaN where
+                a landmark is missing
+            view: Only score the poses configured for this camera view
+            
+        Returns:
+            (P,) accuracies (0-100) in list_configured_poses() order; poses
+            of other views (or none, for an unknown view) score 0
+        """
+        if view is None:
+            points_idx, params, pose_rows = ANGLE_POINTS_IDX, ANGLE_PARAMS, ANGLE_POSE_ROWS
+        elif view in ANGLE_ROWS_BY_VIEW:
+            points_idx, params, pose_rows = ANGLE_ROWS_BY_VIEW[view]
         else:
-            # Outside tolerance: 0-85% score (steeper decrease)
-            excess_deviation = deviation - angle_def.tolerance
-            # Decrease from 85 to 0 over the next tolerance range
-            score = max(0, 85 - (excess_deviation / angle_def.tolerance) * 85)
+            return np.zeros(len(list_configured_poses()))
+        
+        angle_points = user_xy[points_idx]  # (N, 3, 2) for all scored poses' angles
+        actual_angles = calculate_angles(
+            angle_points[:, 0],
+            angle_points[:, 1],
+            angle_points[:, 2]
+        )
+        _, scores = self._score_against(params, actual_angles)
+        
+        valid = ~np.isnan(actual_angles)
+        weights = np.where(valid, params[:, ANGLE_PARAM_COL["weight"]], 0.0)
+        
+        # Per-pose sums of the rows belonging to each pose
+        pose_count = len(list_configured_poses())
+        total_weight = np.bincount(pose_rows, weights=weights, minlength=pose_count)
+        weighted_sum = np.bincount(
+            pose_rows,
+            weights=np.where(valid, scores, 0.0) * weights,
+            minlength=pose_count
+        )
+        
+        return np.divide(
+            weighted_sum,
+            total_weight,
+            out=np.zeros_like(total_weight),
+            where=total_weight > 0
+        )
+    
+    def _keypoints_in_mask(self, names: List[str], mask: int) -> List[str]:
+        """Names (in the given order) whose landmark bit is set in mask"""
+        if not mask:
+            return []
+        return [
+            name for name in names
+            if name in LANDMARK_INDICES and (mask >> LANDMARK_INDICES[name]) & 1
+        ]
+    
+    def _build_angle_score(
+        self,
+        angle_def: AngleDefinition,
+        actual_angle: float,
+        deviation: float,
+        score: float
+    ) -> Dict:
+        """Build the score entry for a single angle"""
         
         # Determine status and color based on score
         if score >= 85:
@@ -288,29 +556,32 @@ class ManualAccuracyCalculator:
     
     def _calculate_connections(
         self,
-        keypoint_dict: Dict[str, Keypoint],
-        connection_definitions: List
+        user_xy: np.ndarray,
+        user_visibility: np.ndarray,
+        present_mask: int,
+        connection_definitions: List[ConnectionDefinition]
     ) -> Dict:
         """
         Calculate scores for body part connections (e.g., hand holds foot)
         
         Args:
-            keypoint_dict: Dictionary of keypoints by name
+            user_xy: (33, 2) user coordinates in landmark order
+            user_visibility: (33,) user visibilities in landmark order
+            present_mask: Bitmask of the landmarks the user sent
             connection_definitions: List of ConnectionDefinition objects
             
         Returns:
             Dictionary with connection scores
         """
-        from app.config.pose_angles import ConnectionDefinition
-        
         connection_scores = []
         total_score = 0.0
         total_weight = 0.0
         
         for conn_def in connection_definitions:
             # Get the two keypoints
-            if conn_def.point1 not in keypoint_dict or conn_def.point2 not in keypoint_dict:
-                print(f"DEBUG: Connection '{conn_def.name}' - keypoints not found")
+            idx1, idx2 = conn_def.point1_idx, conn_def.point2_idx
+            if not (present_mask >> idx1) & 1 or not (present_mask >> idx2) & 1:
+                logger.debug("Connection '%s' - keypoints not found", conn_def.name)
                 # Add placeholder with 0% score
                 connection_scores.append({
                     "connection_name": conn_def.name,
@@ -327,15 +598,15 @@ class ManualAccuracyCalculator:
                 })
                 continue
             
-            kp1 = keypoint_dict[conn_def.point1]
-            kp2 = keypoint_dict[conn_def.point2]
+            visibility1 = float(user_visibility[idx1])
+            visibility2 = float(user_visibility[idx2])
             
             # Check visibility - very lenient for connections (0.1 instead of 0.5)
             # Connections just need approximate positions for distance checking
             # Even partially visible keypoints can give useful proximity data
             min_visibility = 0.1
-            if kp1.visibility < min_visibility or kp2.visibility < min_visibility:
-                print(f"DEBUG: Connection '{conn_def.name}' - low visibility: {kp1.visibility:.3f}, {kp2.visibility:.3f}")
+            if visibility1 < min_visibility or visibility2 < min_visibility:
+                logger.debug("Connection '%s' - low visibility: %.3f, %.3f", conn_def.name, visibility1, visibility2)
                 # Add placeholder with 0% score but show visibility issue
                 connection_scores.append({
                     "connection_name": conn_def.name,
@@ -348,21 +619,25 @@ class ManualAccuracyCalculator:
                     "color": "gray",
                     "symbol": "?",
                     "weight": conn_def.weight,
-                    "message": f"Low visibility ({max(kp1.visibility, kp2.visibility):.1%})"
+                    "message": f"Low visibility ({max(visibility1, visibility2):.1%})"
                 })
                 continue
             
-            # Calculate distance
-            distance = math.sqrt(
-                (kp1.x - kp2.x) ** 2 + 
-                (kp1.y - kp2.y) ** 2
-            )
+            # Calculate distance (still needed for the response, but the
+            # out-of-range check works on the squared distance)
+            (x1, y1), (x2, y2) = user_xy[idx1].tolist(), user_xy[idx2].tolist()
+            dx, dy = x1 - x2, y1 - y2
+            distance_sq = dx * dx + dy * dy
+            distance = math.sqrt(distance_sq)
             
-            print(f"DEBUG: Connection '{conn_def.name}' - distance: {distance:.3f}, max: {conn_def.max_distance}")
+            logger.debug("Connection '%s' - distance: %.3f, max: %s", conn_def.name, distance, conn_def.max_distance)
             
             # Calculate score based on distance
             # 0 distance = 100%, max_distance = 0%
-            score = max(0, 100 * (1 - distance / conn_def.max_distance))
+            if distance_sq >= conn_def.max_distance_sq:
+                score = 0
+            else:
+                score = max(0, 100 * (1 - distance / conn_def.max_distance))
             
             # Determine status
             if score >= 85:
@@ -407,7 +682,8 @@ class ManualAccuracyCalculator:
     
     def _calculate_position_matching(
         self,
-        user_keypoints: List[Keypoint],
+        user_array: np.ndarray,
+        user_rows: Dict[str, int],
         reference_keypoints: List[Keypoint],
         required_keypoint_names: List[str]
     ) -> Dict:
@@ -415,66 +691,66 @@ class ManualAccuracyCalculator:
         Calculate position matching score between user and reference pose
         
         Args:
-            user_keypoints: User's detected keypoints
+            user_array: (N, 4) user keypoints as x, y, z, visibility
+            user_rows: Row of user_array for each keypoint name
             reference_keypoints: Reference pose keypoints
             required_keypoint_names: List of keypoint names to check
             
         Returns:
             Dictionary with position matching scores
         """
-        print(f"DEBUG Position: user_keypoints={len(user_keypoints)}, reference={len(reference_keypoints)}, required={len(required_keypoint_names)}")
+        logger.debug(
+            "Position: user_keypoints=%d, reference=%d, required=%d",
+            len(user_array), len(reference_keypoints), len(required_keypoint_names)
+        )
         
-        # Convert to dictionaries
-        user_dict = {kp.name: kp for kp in user_keypoints if kp.name}
-        ref_dict = {kp.name: kp for kp in reference_keypoints if kp.name}
+        # Convert the reference to an array (x, y, z, visibility) and row lookups by name
+        ref_array = keypoints_to_array(reference_keypoints)
+        ref_rows = {kp.name: i for i, kp in enumerate(reference_keypoints) if kp.name}
         
         # Normalize keypoints (center and scale)
-        user_normalized = self._normalize_keypoints(user_keypoints)
-        ref_normalized = self._normalize_keypoints(reference_keypoints)
-        
-        print(f"DEBUG Position: normalized user={len(user_normalized)}, ref={len(ref_normalized)}")
-        
-        user_norm_dict = {kp.name: kp for kp in user_normalized if kp.name}
-        ref_norm_dict = {kp.name: kp for kp in ref_normalized if kp.name}
-        
-        keypoint_scores = []
-        total_distance = 0.0
-        count = 0
-        
-        for kp_name in required_keypoint_names:
-            if kp_name in user_norm_dict and kp_name in ref_norm_dict:
-                user_kp = user_norm_dict[kp_name]
-                ref_kp = ref_norm_dict[kp_name]
-                
-                # Skip if visibility too low
-                if user_kp.visibility < 0.3:
-                    continue
-                
-                # Calculate Euclidean distance
-                distance = math.sqrt(
-                    (user_kp.x - ref_kp.x) ** 2 + 
-                    (user_kp.y - ref_kp.y) ** 2
-                )
-                
-                # Convert distance to score (0 distance = 100%, higher distance = lower score)
-                # Distance of 0.5 (50% of normalized space) = 0% score
-                # This is more forgiving for overall body position matching
-                max_distance = 0.3
-                score = max(0, 100 * (1 - distance / max_distance))
-                
-                keypoint_scores.append({
-                    "keypoint": kp_name,
-                    "distance": round(distance, 3),
-                    "score": round(score, 1)
-                })
-                
-                total_distance += distance
-                count += 1
+        user_xy = self._normalize_xy(user_array)
+        ref_xy = self._normalize_xy(ref_array)
+        
+        logger.debug("Position: normalized user=%d, ref=%d", len(user_xy), len(ref_xy))
+        
+        # Required keypoints present in both poses and visible enough in the user pose
+        matched = [
+            (kp_name, user_rows[kp_name], ref_rows[kp_name])
+            for kp_name in required_keypoint_names
+            if kp_name in user_rows and kp_name in ref_rows
+            and user_array[user_rows[kp_name], 3] >= 0.3
+        ]
+        names = [kp_name for kp_name, _, _ in matched]
+        user_idx = np.array([i for _, i, _ in matched], dtype=np.intp)
+        ref_idx = np.array([j for _, _, j in matched], dtype=np.intp)
+        
+        # Euclidean distances for all matched keypoints at once
+        diff = user_xy[user_idx] - ref_xy[ref_idx]
+        distances = np.sqrt(diff[:, 0] ** 2 + diff[:, 1] ** 2)
+        
+        # Convert distance to score (0 distance = 100%, higher distance = lower score)
+        # Distance of 0.5 (50% of normalized space) = 0% score
+        # This is more forgiving for overall body position matching
+        max_distance = 0.3
+        scores = np.maximum(0, 100 * (1 - distances / max_distance))
+        
+        keypoint_scores = [
+            {
+                "keypoint": kp_name,
+                "distance": round(float(distance), 3),
+                "score": round(float(score), 1)
+            }
+            for kp_name, distance, score in zip(names, distances, scores)
+        ]
+        
+        total_distance = float(distances.sum())
+        count = len(names)
         
         avg_distance = total_distance / count if count > 0 else 1.0
         overall_score = max(0, 100 * (1 - avg_distance / 0.5))
         
-        print(f"DEBUG Position: matched {count} keypoints, avg_distance={avg_distance:.3f}, score={overall_score:.1f}%")
+        logger.debug("Position: matched %d keypoints, avg_distance=%.3f, score=%.1f%%", count, avg_distance, overall_score)
         
         return {
             "overall_position_score": round(overall_score, 2),
@@ -482,44 +758,35 @@ class ManualAccuracyCalculator:
             "keypoint_scores": keypoint_scores
         }
     
-    def _normalize_keypoints(self, keypoints: List[Keypoint]) -> List[Keypoint]:
+    def _normalize_xy(self, keypoint_array: np.ndarray) -> np.ndarray:
         """
-        Normalize keypoints by centering and scaling
+        Normalize keypoint x, y by centering and scaling
+        
+        Args:
+            keypoint_array: (N, 4) array of x, y, z, visibility
+            
+        Returns:
+            (N, 2) array of normalized x, y
         """
-        if not keypoints:
-            return keypoints
+        xy = keypoint_array[:, :2]
         
         # Find bounding box - use lenient visibility threshold
-        xs = [kp.x for kp in keypoints if kp.visibility > 0.3]
-        ys = [kp.y for kp in keypoints if kp.visibility > 0.3]
+        visible = xy[keypoint_array[:, 3] > 0.3]
         
-        if not xs or not ys:
-            return keypoints
+        if len(visible) == 0:
+            return xy
         
-        min_x, max_x = min(xs), max(xs)
-        min_y, max_y = min(ys), max(ys)
+        min_x, min_y = visible.min(axis=0)
+        max_x, max_y = visible.max(axis=0)
         
         # Calculate center and scale
-        center_x = (min_x + max_x) / 2
-        center_y = (min_y + max_y) / 2
+        center = np.array([(min_x + max_x) / 2, (min_y + max_y) / 2])
         scale = max(max_x - min_x, max_y - min_y)
         
         if scale == 0:
             scale = 1.0
         
-        # Normalize each keypoint
-        normalized = []
-        for kp in keypoints:
-            normalized.append(Keypoint(
-                landmark_id=kp.landmark_id,
-                name=kp.name,
-                x=(kp.x - center_x) / scale,
-                y=(kp.y - center_y) / scale,
-                z=kp.z,
-                visibility=kp.visibility
-            ))
-        
-        return normalized
+        return (xy - center) / scale
 
 
 # Singleton instance
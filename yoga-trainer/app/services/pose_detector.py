@@ -2,7 +2,7 @@ import mediapipe as mp
 import cv2
 import numpy as np
 import base64
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from io import BytesIO
 from PIL import Image
 
@@ -10,6 +10,21 @@ from app.models.pose import Keypoint, Pose
 from app.config import settings
 
 
+def decode_base64_payload(base64_string: str) -> bytes:
+    """
+    Decode a base64 string or data URL ("data:image/jpeg;base64,...") to bytes
+    
+    Args:
+        base64_string: Base64 encoded data, with or without data URL header
+        
+    Returns:
+        Decoded bytes
+    """
+    # Remove header if present
+    header, comma, payload = base64_string.partition(",")
+    return base64.b64decode(payload if comma else header)
+
+
 class PoseDetector:
     """MediaPipe-based pose detection service"""
     
@@ -46,13 +61,18 @@ class PoseDetector:
         Returns:
             Image as numpy array (BGR format for OpenCV)
         """
-        # Remove header if present
-        if "," in base64_string:
-            base64_string = base64_string.split(",")[1]
-        
-        # Decode base64
-        image_bytes = base64.b64decode(base64_string)
+        return self.decode_image_bytes(decode_base64_payload(base64_string))
+    
+    def decode_image_bytes(self, image_bytes: bytes) -> np.ndarray:
+        """
+        Decode encoded image bytes (JPEG, PNG, ...) to numpy array
         
+        Args:
+            image_bytes: Raw image file bytes
+            
+        Returns:
+            Image as numpy array (BGR format for OpenCV)
+        """
         # Convert to PIL Image
         image = Image.open(BytesIO(image_bytes))
         
@@ -77,6 +97,21 @@ class PoseDetector:
         Returns:
             Pose object with keypoints or None if detection fails
         """
+        detection = self.detect_pose_with_keypoint_data(image)
+        return detection[0] if detection is not None else None
+    
+    def detect_pose_with_keypoint_data(self, image: np.ndarray) -> Optional[Tuple[Pose, List[Dict]]]:
+        """
+        Detect pose from image, also returning the keypoints as plain dicts
+        
+        Args:
+            image: Image as numpy array (BGR format)
+            
+        Returns:
+            (Pose, keypoint dicts) tuple, or None if detection fails. The dicts
+            hold the same fields as Keypoint and can be written out as JSON
+            without serializing the models.
+        """
         # Convert BGR to RGB for MediaPipe
         image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
         
@@ -87,24 +122,24 @@ class PoseDetector:
             return None
         
         # Extract keypoints
-        keypoints = []
+        keypoint_data = []
         for i, landmark in enumerate(results.pose_landmarks.landmark):
             # Clamp values to [0, 1] range to handle floating-point precision issues
-            keypoint = Keypoint(
-                landmark_id=i,
-                name=self.landmark_names[i] if i < len(self.landmark_names) else f"landmark_{i}",
-                x=max(0.0, min(1.0, landmark.x)),
-                y=max(0.0, min(1.0, landmark.y)),
-                z=landmark.z,  # z can be outside [0, 1] range
-                visibility=max(0.0, min(1.0, landmark.visibility))
-            )
-            keypoints.append(keypoint)
+            keypoint_data.append({
+                "landmark_id": i,
+                "name": self.landmark_names[i] if i < len(self.landmark_names) else f"landmark_{i}",
+                "x": max(0.0, min(1.0, landmark.x)),
+                "y": max(0.0, min(1.0, landmark.y)),
+                "z": landmark.z,  # z can be outside [0, 1] range
+                "visibility": max(0.0, min(1.0, landmark.visibility))
+            })
+        keypoints = [Keypoint(**kp) for kp in keypoint_data]
         
         # Calculate overall confidence (average visibility of key landmarks)
         key_landmarks = [11, 12, 23, 24]  # Shoulders and hips
         confidence = np.mean([keypoints[i].visibility for i in key_landmarks if i < len(keypoints)])
         
-        return Pose(keypoints=keypoints, confidence=float(confidence))
+        return Pose(keypoints=keypoints, confidence=float(confidence)), keypoint_data
     
     def detect_pose_from_base64(self, base64_string: str) -> Optional[Pose]:
         """
@@ -123,6 +158,24 @@ class PoseDetector:
             print(f"Error detecting pose from base64: {e}")
             return None
     
+    def detect_pose_from_bytes(self, image_bytes: bytes) -> Optional[Tuple[Pose, List[Dict]]]:
+        """
+        Detect pose from encoded image bytes
+        
+        Args:
+            image_bytes: Raw image file bytes
+            
+        Returns:
+            (Pose, keypoint dicts) tuple as from detect_pose_with_keypoint_data,
+            or None
+        """
+        try:
+            image = self.decode_image_bytes(image_bytes)
+            return self.detect_pose_with_keypoint_data(image)
+        except Exception as e:
+            print(f"Error detecting pose from image bytes: {e}")
+            return None
+    
     def detect_pose_from_file(self, file_path: str) -> Optional[Pose]:
         """
         Detect pose from image file
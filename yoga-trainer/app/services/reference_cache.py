@@ -0,0 +1,92 @@
+"""
+In-memory cache for reference pose files.
+
+Entries are keyed by pose id and validated against the file's mtime, so edits
+to a reference JSON on disk are picked up on the next request.
+"""
+
+import mmap
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Tuple
+
+import numpy as np
+
+from app.models.pose import Keypoint
+from app.config import settings
+from app.utils.json_utils import json_loads
+
+
+class ReferencePoseData(NamedTuple):
+    """Parsed reference pose, with keypoints both as models and as arrays"""
+    keypoints: List[Keypoint]
+    xyz: np.ndarray  # (N, 3) float32
+    visibility: np.ndarray  # (N,) float32
+    data: Dict
+
+
+# pose_id -> (mtime_ns, parsed reference)
+_reference_cache: Dict[str, Tuple[int, ReferencePoseData]] = {}
+
+
+def _parse_mapped(path: Path) -> Dict:
+    """Parse a JSON file straight from a read-only memory map of it"""
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can't be mapped
+            return json_loads(f.read())
+    
+    with mapped, memoryview(mapped) as view:
+        return json_loads(view)
+
+
+def load_reference(pose_id: str) -> ReferencePoseData:
+    """
+    Load reference keypoints for a pose, reusing the parsed file when unchanged
+
+    Args:
+        pose_id: Reference pose identifier (JSON file stem)
+
+    Returns:
+        ReferencePoseData with Keypoint models, (N, 3) coordinates,
+        visibilities and the raw pose data
+
+    Raises:
+        FileNotFoundError: If no reference file exists for the pose
+        ValueError: If the file is not a reference pose object with keypoints
+    """
+    reference_file = settings.reference_keypoints_dir / f"{pose_id}.json"
+    mtime_ns = reference_file.stat().st_mtime_ns
+
+    cached = _reference_cache.get(pose_id)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    pose_data = _parse_mapped(reference_file)
+    if not isinstance(pose_data, dict) or "keypoints" not in pose_data:
+        raise ValueError(f"Not a reference pose file: {reference_file}")
+    raw_keypoints = pose_data["keypoints"]
+    count = len(raw_keypoints)
+
+    xyz = np.fromiter(
+        (v for kp in raw_keypoints for v in (kp["x"], kp["y"], kp["z"])),
+        dtype=np.float32,
+        count=3 * count
+    ).reshape(-1, 3)
+    visibility = np.fromiter(
+        (kp["visibility"] for kp in raw_keypoints),
+        dtype=np.float32,
+        count=count
+    )
+
+    reference = ReferencePoseData(
+        keypoints=[Keypoint(**kp) for kp in raw_keypoints],
+        xyz=xyz,
+        visibility=visibility,
+        data=pose_data
+    )
+
+    _reference_cache[pose_id] = (mtime_ns, reference)
+    return reference
+
@@ -0,0 +1,137 @@
+"""
+Summary index of reference poses.
+
+Listing poses only needs a few fields from each reference file, so those
+are kept in a single _index.json in the reference poses directory instead
+of parsing every pose (and its keypoints) on every request. The index sits
+outside the keypoints directory so it can never be mistaken for a pose. It
+is rebuilt when missing or older than the keypoints directory or any pose
+file in it, which also covers newly uploaded reference poses.
+"""
+
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from app.config import settings
+from app.utils.json_utils import json_loads, json_dumps_pretty
+
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "_index.json"
+
+# (mtime_ns, entries) of the last index read from disk
+_index_cache: Optional[Tuple[int, List[Dict]]] = None
+
+# Route handlers run in a thread pool, so serialize index rewrites
+_index_lock = threading.Lock()
+
+
+def make_index_entry(pose_id: str, pose_data: Dict) -> Dict:
+    """
+    Build the summary entry for a reference pose
+
+    Args:
+        pose_id: Pose identifier (keypoint file stem)
+        pose_data: Parsed reference pose JSON
+
+    Returns:
+        Dictionary with the fields used when listing poses
+    """
+    pose_id = pose_data.get("pose_id", pose_id)
+    base_pose_name = pose_data.get("base_pose_name") or pose_id.rpartition("_")[0] or pose_id
+
+    return {
+        "pose_id": pose_id,
+        "base_pose_name": base_pose_name,
+        "view_angle": pose_data.get("view_angle", "front"),
+        "name": pose_data.get("name", base_pose_name.replace("_", " ").title()),
+        "difficulty": pose_data.get("difficulty", "beginner"),
+        "reference_image": pose_data.get("reference_image")
+    }
+
+
+def _write_index(entries: List[Dict]) -> None:
+    """Atomically replace the index file"""
+    index_file = settings.reference_poses_dir / INDEX_FILENAME
+    tmp_file = index_file.with_suffix(".tmp")
+    with _index_lock:
+        tmp_file.write_bytes(json_dumps_pretty(entries))
+        os.replace(tmp_file, index_file)
+
+
+def build_index() -> List[Dict]:
+    """
+    Scan the keypoints directory and rewrite the index
+
+    Returns:
+        List of index entries sorted by pose_id
+    """
+    keypoints_dir = settings.reference_keypoints_dir
+    keypoints_dir.mkdir(parents=True, exist_ok=True)
+
+    with os.scandir(keypoints_dir) as it:
+        pose_files = sorted(
+            (entry for entry in it
+             if entry.name.endswith(".json") and entry.is_file()),
+            key=lambda entry: entry.name
+        )
+
+    entries = []
+    for pose_file in pose_files:
+        try:
+            with open(pose_file.path, "rb") as f:
+                pose_data = json_loads(f.read())
+            entries.append(make_index_entry(pose_file.name[:-len(".json")], pose_data))
+        except Exception as e:
+            logger.warning("Error indexing pose %s: %s", pose_file.path, e)
+
+    _write_index(entries)
+    return entries
+
+
+def _newest_mtime_ns(keypoints_dir: Path) -> int:
+    """
+    Latest modification time among the keypoints directory and its pose
+    files. The directory's own mtime changes when files are added, removed
+    or renamed; a pose file edited in place only changes its own
+    """
+    newest = keypoints_dir.stat().st_mtime_ns
+    with os.scandir(keypoints_dir) as it:
+        for entry in it:
+            if entry.name.endswith(".json") and entry.is_file():
+                newest = max(newest, entry.stat().st_mtime_ns)
+    return newest
+
+
+def load_index() -> List[Dict]:
+    """
+    Get the index entries, rebuilding the index if it does not exist yet or
+    pose files were added, removed or modified since it was written
+
+    Returns:
+        List of index entries
+    """
+    global _index_cache
+
+    keypoints_dir = settings.reference_keypoints_dir
+    index_file = settings.reference_poses_dir / INDEX_FILENAME
+    try:
+        mtime_ns = index_file.stat().st_mtime_ns
+        stale = _newest_mtime_ns(keypoints_dir) > mtime_ns
+    except FileNotFoundError:
+        stale = True
+
+    if stale:
+        build_index()
+        mtime_ns = index_file.stat().st_mtime_ns
+
+    if _index_cache is not None and _index_cache[0] == mtime_ns:
+        return _index_cache[1]
+
+    entries = json_loads(index_file.read_bytes())
+    _index_cache = (mtime_ns, entries)
+    return entries
@@ -29,6 +29,30 @@ def calculate_angle(point1: Keypoint, point2: Keypoint, point3: Keypoint) -> flo
     return np.degrees(angle)
 
 
+def calculate_angles(points1: np.ndarray, points2: np.ndarray, points3: np.ndarray) -> np.ndarray:
+    """
+    Vectorized calculate_angle over arrays of points
+    
+    Args:
+        points1: (..., 2+) array of first points
+        points2: (..., 2+) array of vertex points
+        points3: (..., 2+) array of third points
+        
+    Returns:
+        Array of angles in degrees (0-180) at each vertex
+    """
+    vector1 = points1[..., :2] - points2[..., :2]
+    vector2 = points3[..., :2] - points2[..., :2]
+    
+    dot = np.einsum('...i,...i->...', vector1, vector2)
+    norms = np.linalg.norm(vector1, axis=-1) * np.linalg.norm(vector2, axis=-1)
+    cos_angle = np.clip(dot / (norms + 1e-6), -1.0, 1.0)
+    
+    # Exact arccos on purpose: a lookup table is coarsest near 0 and 180
+    # degrees (a 1024-entry table reads 179 as 180), where most targets lie
+    return np.degrees(np.arccos(cos_angle))
+
+
 def euclidean_distance(point1: Keypoint, point2: Keypoint) -> float:
     """Calculate Euclidean distance between two keypoints"""
     return np.sqrt((point1.x - point2.x)**2 + (point1.y - point2.y)**2)
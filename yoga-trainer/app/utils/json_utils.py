@@ -0,0 +1,17 @@
+"""
+JSON helpers backed by orjson
+"""
+
+from typing import Any
+
+import orjson
+
+
+def json_loads(data: bytes) -> Any:
+    """Parse JSON from bytes, memoryview (or str)"""
+    return orjson.loads(data)
+
+
+def json_dumps_pretty(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes indented by 2 spaces"""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
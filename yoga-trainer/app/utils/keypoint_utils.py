@@ -42,6 +42,26 @@ LANDMARK_INDICES = {
 }
 
 
+def mirrored_landmark_name(name: str) -> str:
+    """Swap left and right in a landmark name (e.g. 'left_knee' -> 'right_knee', 'mouth_left' -> 'mouth_right')"""
+    for side, other in (("left", "right"), ("right", "left")):
+        if name.startswith(side + "_"):
+            return other + name[len(side):]
+        if name.endswith("_" + side):
+            return name[:-len(side)] + other
+    return name
+
+
+# Index of each landmark's left/right counterpart (the nose maps to itself).
+# Indexing a (33, ...) landmark array with it relabels a frame as if the pose
+# were done on the other side
+MIRRORED_LANDMARKS = np.array(
+    [LANDMARK_INDICES[mirrored_landmark_name(name)] for name in LANDMARK_INDICES],
+    dtype=np.intp
+)
+MIRRORED_LANDMARKS.setflags(write=False)
+
+
 def normalize_keypoints(keypoints: List[Keypoint]) -> List[Keypoint]:
     """
     Normalize keypoints to be scale and translation invariant
@@ -88,6 +108,35 @@ def normalize_keypoints(keypoints: List[Keypoint]) -> List[Keypoint]:
     return normalized
 
 
+def normalize_keypoint_array(xyz: np.ndarray) -> np.ndarray:
+    """
+    Array version of normalize_keypoints
+    
+    Args:
+        xyz: (N, 3) array of keypoint coordinates in landmark order, or a
+            (B, N, 3) stack of poses
+        
+    Returns:
+        Normalized float64 array of the same shape
+    """
+    # Stored keypoints may be float32; normalize in float64 so small
+    # shoulder widths don't amplify rounding error in the angles
+    xyz = np.asarray(xyz, dtype=np.float64)
+    if xyz.shape[-2] < 33:
+        return xyz
+    
+    hip_center = xyz[..., [23, 24], :2].mean(axis=-2, keepdims=True)
+    
+    shoulder_width = np.linalg.norm(xyz[..., 12, :2] - xyz[..., 11, :2], axis=-1)
+    shoulder_width = np.where(shoulder_width < 0.01, 0.1, shoulder_width)[..., None]
+    
+    normalized = np.empty_like(xyz)
+    normalized[..., :2] = (xyz[..., :2] - hip_center) / shoulder_width[..., None]
+    normalized[..., 2] = xyz[..., 2] / shoulder_width
+    
+    return normalized
+
+
 def get_keypoint_by_name(keypoints: List[Keypoint], name: str) -> Keypoint:
     """Get keypoint by landmark name"""
     landmark_id = LANDMARK_INDICES.get(name)
@@ -139,7 +188,7 @@ def filter_low_confidence_keypoints(keypoints: List[Keypoint], threshold: float
 
 def keypoints_to_array(keypoints: List[Keypoint]) -> np.ndarray:
     """Convert keypoints to numpy array (N x 4: x, y, z, visibility)"""
-    return np.array([[kp.x, kp.y, kp.z, kp.visibility] for kp in keypoints])
+    return np.array([[kp.x, kp.y, kp.z, kp.visibility] for kp in keypoints]).reshape(-1, 4)
 
 
 def array_to_keypoints(array: np.ndarray) -> List[Keypoint]:
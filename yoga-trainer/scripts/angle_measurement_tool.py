@@ -19,6 +19,15 @@ class AngleMeasurementTool:
         "right hand": ("right_shoulder", "right_elbow", "right_wrist"),
         # Add more mappings as needed
     }
+    # Default required keypoints; matches _FULL_BODY_KPS in pose_angles.py
+    FULL_BODY_KEYPOINTS = [
+        "nose", "left_shoulder", "right_shoulder",
+        "left_elbow", "right_elbow",
+        "left_wrist", "right_wrist",
+        "left_hip", "right_hip",
+        "left_knee", "right_knee",
+        "left_ankle", "right_ankle"
+    ]
     def __init__(self, image_path):
         self.image_path = image_path
         self.image = cv2.imread(str(image_path))
@@ -295,7 +304,7 @@ class AngleMeasurementTool:
         print("=" * 70)
         print("\nrequired_angles=[")
         for measurement in self.angles_measured:
-            print(f"    AngleDefinition(")
+            print(f"    _ad(")
             print(f"        name=\"{measurement['name']}\",")
             print(f"        points=(\"point1_name\", \"vertex_name\", \"point2_name\"),  # TODO: Update with actual keypoint names")
             print(f"        target_angle={measurement['target_angle']},")
@@ -347,13 +356,12 @@ class AngleMeasurementTool:
             print("            left_wrist, right_wrist, left_hip, right_hip, left_knee,")
             print("            right_knee, left_ankle, right_ankle")
             print()
-            default_keypoints = "nose, left_shoulder, right_shoulder, left_elbow, right_elbow, left_wrist, right_wrist, left_hip, right_hip, left_knee, right_knee, left_ankle, right_ankle"
             keypoints_input = input(f"Enter required keypoints (comma-separated) or press Enter for defaults:\n").strip()
             
             if keypoints_input:
                 required_keypoints = [kp.strip() for kp in keypoints_input.split(",")]
             else:
-                required_keypoints = [kp.strip() for kp in default_keypoints.split(",")]
+                required_keypoints = list(self.FULL_BODY_KEYPOINTS)
             
             # Build the configuration code
             config_code = self.generate_pose_config_code(
@@ -434,18 +442,22 @@ class AngleMeasurementTool:
     
     def generate_pose_config_code(self, pose_id, display_name, view, required_keypoints):
         """Generate the Python code for pose configuration"""
-        keypoints_str = ",\n            ".join([f'"{kp}"' for kp in required_keypoints])
+        if required_keypoints == self.FULL_BODY_KEYPOINTS:
+            keypoints_code = "_FULL_BODY_KPS"
+        else:
+            keypoints_str = ",\n            ".join([f'"{kp}"' for kp in required_keypoints])
+            keypoints_code = f"(\n            {keypoints_str},\n        )"
         code = f'    # {display_name} ({view.capitalize()} View)\n'
-        code += f'    "{pose_id}": PoseAngleConfig(\n'
+        code += f'    "{pose_id}": _pc(\n'
         code += f'        pose_name="{display_name}",\n'
         code += f'        view="{view}",\n'
-        code += f'        required_keypoints=[\n            {keypoints_str}\n        ],\n'
+        code += f'        required_keypoints={keypoints_code},\n'
         code += f'        required_angles=[\n'
         for measurement in self.angles_measured:
             angle_name = measurement['name'].lower()
             keypoints = self.ANGLE_KEYPOINT_MAP.get(angle_name)
             if keypoints:
-                code += f'            AngleDefinition(\n'
+                code += f'            _ad(\n'
                 code += f'                name="{measurement["name"]}",\n'
                 code += f'                points={keypoints},\n'
                 code += f'                target_angle={measurement["target_angle"]},\n'
@@ -453,7 +465,7 @@ class AngleMeasurementTool:
                 code += f'                weight={measurement["weight"]}\n'
                 code += f'            ),\n'
             else:
-                code += f'            AngleDefinition(\n'
+                code += f'            _ad(\n'
                 code += f'                name="{measurement["name"]}",\n'
                 code += f'                points=("point1_name", "vertex_name", "point2_name"),  # TODO: Update with actual keypoint names\n'
                 code += f'                target_angle={measurement["target_angle"]},\n'
@@ -468,7 +480,7 @@ class AngleMeasurementTool:
         """Remove existing pose configuration from content"""
         # Find the pose entry
         import re
-        pattern = r'"' + re.escape(pose_id) + r'"\s*:\s*PoseAngleConfig\([^)]+\),' 
+        pattern = r'"' + re.escape(pose_id) + r'"\s*:\s*_pc\([^)]+\),' 
         
         # This is a simple removal - for complex nested structures, might need better parsing
         # For now, we'll just warn the user and keep the old one
@@ -12,6 +12,7 @@ import shutil
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.services.pose_detector import get_pose_detector
+from app.services.reference_index import build_index
 
 
 def process_reference_poses():
@@ -119,11 +120,15 @@ def process_reference_poses():
             print(f"   ❌ Error: {str(e)}")
             failed_count += 1
     
+    # Rebuild the pose index used by the list endpoint
+    index_entries = build_index()
+    
     # Summary
     print(f"\n{'='*60}")
     print(f"📊 Processing Complete!")
     print(f"✅ Successfully processed: {processed_count} poses")
     print(f"❌ Failed: {failed_count} poses")
+    print(f"📇 Indexed: {len(index_entries)} reference poses")
     print(f"{'='*60}")
 
 